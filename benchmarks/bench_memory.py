@@ -0,0 +1,29 @@
+"""Report the memory used by each Board instance."""
+
+import argparse
+import tracemalloc
+
+from ludo.board import Board
+
+
+def bytes_per_board(num_boards):
+    """Measure the average bytes allocated by keeping boards alive."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    boards = [Board() for i in range(num_boards)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del boards
+    return (after - before) / num_boards
+
+
+def main():
+    """Print bytes per board for the requested number of boards."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=1000)
+    args = parser.parse_args()
+    print(f"{bytes_per_board(args.boards):.0f} bytes per Board")
+
+
+if __name__ == "__main__":
+    main()
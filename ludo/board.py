@@ -1,6 +1,86 @@
 """Board Package."""
 
-from ludo.house import HouseType, House
+import random
+from collections import namedtuple
+
+from ludo.house import HouseType, House, NUM_TRACK_NODES, PATH_LENGTH
+from ludo.ids import IdAllocator
+
+NUM_HOUSES = 4
+# Number of squares on the shared track.
+NUM_SQUARES = NUM_TRACK_NODES * NUM_HOUSES
+# Squares a token can land on before it turns into the house nodes.
+LAST_TRACK_PROGRESS = 50
+# Mask of the track progress 0..50 of a house.
+TRACK_PROGRESS_MASK = (1 << (LAST_TRACK_PROGRESS + 1)) - 1
+ALL_SQUARES_MASK = (1 << NUM_SQUARES) - 1
+NUM_TOKENS = 16
+
+# Random 64 bit keys of the Zobrist position hash. They come from a fixed
+# seed so position keys are the same in every process and run.
+_zobrist_rng = random.Random(1459)
+# Key of each token, by index in id order, for progress -1 to 56.
+TOKEN_KEYS = [
+    [_zobrist_rng.getrandbits(64) for progress in range(PATH_LENGTH + 1)]
+    for token_index in range(NUM_TOKENS)
+]
+HOUSE_KEYS = [_zobrist_rng.getrandbits(64) for index in range(NUM_HOUSES)]
+EXTRA_TURN_KEY = _zobrist_rng.getrandbits(64)
+
+
+class BoardState(
+    namedtuple(
+        "BoardState",
+        [
+            "progress",
+            "in_house",
+            "current_house",
+            "next_houses",
+            "finish_order",
+            "extra_turn",
+        ],
+    )
+):
+    """
+    Compact immutable state of a board position.
+
+    Tokens are listed in id order with their path progress and in_house
+    flag. Houses are stored as their index in the board's turn order. The
+    extra turn flag tells the current house rolls again.
+    """
+
+    __slots__ = ()
+
+    @property
+    def winner(self):
+        """Get the index of the winner house, or -1 while there is none."""
+        if self.finish_order:
+            return self.finish_order[0]
+        return -1
+
+
+class MoveRecord(
+    namedtuple(
+        "MoveRecord",
+        ["token", "previous_progress", "captured", "previous_next_house"],
+    )
+):
+    """
+    Undo record of a move made by Board.make_move.
+
+    The previous progress is -1 when the token was in house, otherwise it
+    is the index of its previous node on the house path. Captured tokens
+    are listed with the progress they had before they were sent back to
+    their house.
+    """
+
+    __slots__ = ()
+
+
+class Move(namedtuple("Move", ["token", "destination", "captures"])):
+    """A legal move of a token to its destination node and its captures."""
+
+    __slots__ = ()
 
 
 class Board:
@@ -11,18 +91,30 @@ class Board:
         Initialize a Board.
 
         When create a board object, every house nodes and tokens create and
-        every node set with next node.
+        every node set with next node. Ids are allocated per board, so every
+        board uses the same node, token and house ids.
         """
-        self.blue_house = House(HouseType.BLUE)
-        self.red_house = House(HouseType.RED)
-        self.green_house = House(HouseType.GREEN)
-        self.yellow_house = House(HouseType.YELLOW)
+        self.ids = IdAllocator()
+        self.blue_house = House(HouseType.BLUE, self.ids)
+        self.red_house = House(HouseType.RED, self.ids)
+        self.green_house = House(HouseType.GREEN, self.ids)
+        self.yellow_house = House(HouseType.YELLOW, self.ids)
 
         self.blue_house.set_next_house(self.red_house)
         self.red_house.set_next_house(self.green_house)
         self.green_house.set_next_house(self.yellow_house)
         self.yellow_house.set_next_house(self.blue_house)
 
+        self.blue_house.board = self
+        self.red_house.board = self
+        self.green_house.board = self
+        self.yellow_house.board = self
+
+        self.blue_house.build_path()
+        self.red_house.build_path()
+        self.green_house.build_path()
+        self.yellow_house.build_path()
+
         self.nodes = []
         self.nodes.extend(self.blue_house.nodes)
         self.nodes.extend(self.red_house.nodes)
@@ -34,35 +126,341 @@ class Board:
         self.tokens.extend(self.red_house.tokens)
         self.tokens.extend(self.yellow_house.tokens)
         self.tokens.extend(self.green_house.tokens)
+        # Keep tokens in id order so snapshots list them in a stable order.
+        self.tokens.sort(key=lambda token: token.id)
 
-        self.winner_house = None
+        # Houses in turn order, snapshots refer to houses by this index.
+        self.houses = [
+            self.blue_house,
+            self.red_house,
+            self.green_house,
+            self.yellow_house,
+        ]
+        # Tokens of each house in id order.
+        self.house_tokens = {
+            house: [token for token in self.tokens if token.house == house]
+            for house in self.houses
+        }
+        # Index of each house in the turn order.
+        self.house_indexes = {
+            house: index for index, house in enumerate(self.houses)
+        }
+
+        # Number the shared track squares from blue's fork node.
+        node = self.blue_house.get_fork_node()
+        for square in range(NUM_SQUARES):
+            node.square = square
+            node = node.next_node
+        self.safe_mask = 0
+        for node in self.nodes:
+            if node.square >= 0 and node.is_safe:
+                self.safe_mask |= 1 << node.square
+        self.start_squares = [
+            house.get_start_node().square for house in self.houses
+        ]
+        # Per house bitmask of track squares with tokens of the house, and
+        # the house's tokens on each square.
+        self.occupancy = [0] * NUM_HOUSES
+        self.square_tokens = [
+            [[] for square in range(NUM_SQUARES)] for house in self.houses
+        ]
+
+        # Id indexes for constant time node and token lookups.
+        self.nodes_by_id = {node.id: node for node in self.nodes}
+        self.tokens_by_id = {token.id: token for token in self.tokens}
+
+        # Houses in the order all their tokens reached end.
+        self._finish_order = []
+
+        # Zobrist keys of each token by progress + 1.
+        self.token_keys = {
+            token: TOKEN_KEYS[index] for index, token in enumerate(self.tokens)
+        }
+        self._current_house = None
+        self._extra_turn = False
+        self.position_key = 0
+        for token in self.tokens:
+            self.position_key ^= self.token_keys[token][token.progress + 1]
+        # The house whose turn it is.
+        self.current_house = self.blue_house
+
+    @property
+    def current_house(self):
+        """Get the house whose turn it is."""
+        return self._current_house
+
+    @current_house.setter
+    def current_house(self, house):
+        """Set the house whose turn it is and update the position key."""
+        if self._current_house is not None:
+            self.position_key ^= HOUSE_KEYS[
+                self.house_indexes[self._current_house]
+            ]
+        self._current_house = house
+        self.position_key ^= HOUSE_KEYS[self.house_indexes[house]]
+
+    @property
+    def extra_turn(self):
+        """Check the current house rolls again."""
+        return self._extra_turn
+
+    @extra_turn.setter
+    def extra_turn(self, extra_turn):
+        """Set the extra turn flag and update the position key."""
+        if extra_turn != self._extra_turn:
+            self.position_key ^= EXTRA_TURN_KEY
+            self._extra_turn = extra_turn
+
+    def compute_position_key(self):
+        """Compute the Zobrist hash of the position from scratch."""
+        key = HOUSE_KEYS[self.house_indexes[self._current_house]]
+        if self._extra_turn:
+            key ^= EXTRA_TURN_KEY
+        for token in self.tokens:
+            key ^= self.token_keys[token][token.progress + 1]
+        return key
 
     def get_node(self, node_id):
         """Get node by node id."""
-        return [node for node in self.nodes if node.id == node_id][0]
+        try:
+            return self.nodes_by_id[node_id]
+        except KeyError:
+            raise KeyError(
+                f"No node with id {node_id} on the board."
+            ) from None
 
     def get_token(self, token_id):
         """Get token by token id."""
-        return [token for token in self.tokens if token.id == token_id][0]
+        try:
+            return self.tokens_by_id[token_id]
+        except KeyError:
+            raise KeyError(
+                f"No token with id {token_id} on the board."
+            ) from None
+
+    def get_nodes(self, node_ids):
+        """Get nodes by node ids."""
+        return [self.get_node(node_id) for node_id in node_ids]
+
+    def get_tokens(self, token_ids):
+        """Get tokens by token ids."""
+        return [self.get_token(token_id) for token_id in token_ids]
+
+    @property
+    def winner_house(self):
+        """
+        Get the first house whose tokens all reached end.
+
+        The winner is derived from the finish order, so it is not sticky: a
+        token moved away from end by Token.reset or Token.place (as when a
+        position is restored) removes its house from the finish order and
+        the next finished house, if any, becomes the winner. In normal play
+        tokens on the end node are never sent back, so the winner is fixed
+        once set.
+        """
+        if self._finish_order:
+            return self._finish_order[0]
+        return None
+
+    @property
+    def finish_order(self):
+        """Get the houses in the order all their tokens reached end."""
+        return tuple(self._finish_order)
+
+    def token_moved(self, token, old_progress, old_square):
+        """
+        Update the position key and occupancy after a token moved.
+
+        Called by the token whenever its node changes, so both stay in step
+        with the nodes in constant time.
+        """
+        keys = self.token_keys[token]
+        self.position_key ^= keys[old_progress + 1] ^ keys[token.progress + 1]
+        self.update_occupancy(token, old_square, token.current_node.square)
+
+    def update_occupancy(self, token, old_square, new_square):
+        """Move a token between squares of its house's occupancy."""
+        if old_square == new_square:
+            return
+        index = self.house_indexes[token.house]
+        square_tokens = self.square_tokens[index]
+        if old_square >= 0:
+            tokens = square_tokens[old_square]
+            tokens.remove(token)
+            if not tokens:
+                self.occupancy[index] &= ~(1 << old_square)
+        if new_square >= 0:
+            tokens = square_tokens[new_square]
+            if not tokens:
+                self.occupancy[index] |= 1 << new_square
+            tokens.append(token)
+
+    def other_occupancy(self, house):
+        """Get the bitmask of squares with tokens of the other houses."""
+        index = self.house_indexes[house]
+        mask = 0
+        for other_index, occupancy in enumerate(self.occupancy):
+            if other_index != index:
+                mask |= occupancy
+        return mask
+
+    def has_capture(self, house, square):
+        """Check a token of the house landing on the square captures."""
+        if square < 0:
+            return False
+        bit = 1 << square
+        return not bit & self.safe_mask and bool(
+            bit & self.other_occupancy(house)
+        )
+
+    def captured_tokens(self, house, square):
+        """
+        Get the tokens a token of the house captures by landing on square.
+
+        Victims come from the occupancy, house by house in turn order.
+        """
+        if not self.has_capture(house, square):
+            return ()
+        bit = 1 << square
+        victims = []
+        for index, occupancy in enumerate(self.occupancy):
+            if occupancy & bit and self.houses[index] != house:
+                victims.extend(self.square_tokens[index][square])
+        return tuple(victims)
+
+    def attack_mask(self, house):
+        """
+        Get the bitmask of squares the house's tokens reach with one roll.
+
+        Squares are turned into the house's own progress frame, where the
+        track is progress 0 to 50, so tokens entering the house nodes do not
+        reach squares beyond their fork node.
+        """
+        start = self.start_squares[self.house_indexes[house]]
+        occupancy = self.occupancy[self.house_indexes[house]]
+        relative = (
+            (occupancy >> start) | (occupancy << (NUM_SQUARES - start))
+        ) & ALL_SQUARES_MASK
+        attacks = 0
+        for roll in range(1, 7):
+            attacks |= relative << roll
+        attacks &= TRACK_PROGRESS_MASK
+        return (
+            (attacks << start) | (attacks >> (NUM_SQUARES - start))
+        ) & ALL_SQUARES_MASK
+
+    def threat_mask(self, house):
+        """Get the bitmask of unsafe squares other houses can capture on."""
+        mask = 0
+        for other in self.houses:
+            if other != house:
+                mask |= self.attack_mask(other)
+        return mask & ~self.safe_mask
+
+    def is_threatened(self, house, square):
+        """Check other houses can capture a token of the house on square."""
+        return square >= 0 and bool(self.threat_mask(house) >> square & 1)
+
+    def house_index(self, house):
+        """Get the index of the house in the board's turn order."""
+        return self.house_indexes[house]
+
+    def snapshot(self):
+        """
+        Get the compact immutable state of the board position.
+
+        To branch a position many times, take one snapshot and restore it
+        on the same board after each branch instead of building new boards.
+        """
+        house_index = self.house_index
+        return BoardState(
+            tuple(token.progress for token in self.tokens),
+            tuple(token.in_house for token in self.tokens),
+            house_index(self.current_house),
+            tuple(house_index(house.next_house) for house in self.houses),
+            tuple(house_index(house) for house in self._finish_order),
+            self._extra_turn,
+        )
+
+    def restore(self, state):
+        """Apply a state taken by snapshot to the board in place."""
+        for token, progress, in_house in zip(
+            self.tokens, state.progress, state.in_house
+        ):
+            if token.progress != progress or token.in_house != in_house:
+                token.place(progress)
+        houses = self.houses
+        self.current_house = houses[state.current_house]
+        self.extra_turn = state.extra_turn
+        for house, next_house in zip(houses, state.next_houses):
+            house.next_house = houses[next_house]
+        self._finish_order = [houses[index] for index in state.finish_order]
+
+    def next_unfinished_house(self, house):
+        """Get the next house in turn order with tokens left, or None."""
+        houses = self.houses
+        index = self.house_indexes[house]
+        for step in range(1, len(houses)):
+            next_house = houses[(index + step) % len(houses)]
+            if not next_house.all_tokens_reached_end():
+                return next_house
+        return None
+
+    def legal_moves(self, house, roll):
+        """
+        Get the distinct legal moves of the house for the dice roll.
+
+        Tokens in house need a 6 to come out and tokens in the house nodes
+        need an exact roll to reach end. Tokens stacked on the same node, or
+        waiting in house, have the same move, so only one of them is listed.
+        """
+        moves = []
+        seen = set()
+        for token in self.house_tokens[house]:
+            progress = token.progress
+            if progress in seen:
+                continue
+            destination = token.destination(roll)
+            if destination is None:
+                continue
+            seen.add(progress)
+            captures = self.captured_tokens(house, destination.square)
+            moves.append(Move(token, destination, captures))
+        return moves
+
+    def make_move(self, token_id, roll):
+        """Move the token by the dice roll and return its undo record."""
+        token = self.get_token(token_id)
+        previous_progress = token.progress
+        previous_next_house = token.house.next_house
+        token.move(roll)
+        captured = ()
+        if token.killed_other_tokens:
+            captured = tuple(
+                zip(
+                    self.get_tokens(token.killed_other_token_ids),
+                    token.killed_other_token_progress,
+                )
+            )
+        return MoveRecord(
+            token, previous_progress, captured, previous_next_house
+        )
+
+    def unmake_move(self, record):
+        """Take back a move using the undo record from make_move."""
+        for token, progress in record.captured:
+            token.place(progress)
+        record.token.place(record.previous_progress)
+        record.token.house.next_house = record.previous_next_house
+
+    def house_finished(self, house):
+        """Record the house whose last token reached end."""
+        self._finish_order.append(house)
+
+    def house_unfinished(self, house):
+        """Forget the finished house after one of its tokens left end."""
+        self._finish_order.remove(house)
 
     def completed(self):
         """Check any 3 houses tokens reached end then game completed."""
-        num_houses_with_all_tokens_reached_end = 0
-        if self.blue_house.all_tokens_reached_end():
-            if not self.winner_house:
-                self.winner_house = self.blue_house
-            num_houses_with_all_tokens_reached_end += 1
-        if self.red_house.all_tokens_reached_end():
-            if not self.winner_house:
-                self.winner_house = self.red_house
-            num_houses_with_all_tokens_reached_end += 1
-        if self.green_house.all_tokens_reached_end():
-            if not self.winner_house:
-                self.winner_house = self.green_house
-            num_houses_with_all_tokens_reached_end += 1
-        if self.yellow_house.all_tokens_reached_end():
-            if not self.winner_house:
-                self.winner_house = self.yellow_house
-            num_houses_with_all_tokens_reached_end += 1
-
-        return num_houses_with_all_tokens_reached_end == 3
+        return len(self._finish_order) >= 3
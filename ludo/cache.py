@@ -0,0 +1,128 @@
+"""Cache Package."""
+
+import atexit
+import struct
+from collections import OrderedDict
+
+from ludo.storage import cache_path, write_atomic
+
+MAGIC = b"LUDOEC1\0"
+FILE_NAME = "evaluations.bin"
+# Entry header: tag length, position key, depth and number of values.
+ENTRY = struct.Struct("<BQiB")
+
+
+class EvalCache:
+    """
+    Bounded cache of position evaluations with least recently used eviction.
+
+    Keys are built by the caller from Board.position_key and whatever else
+    the value depends on, such as the evaluator and search depth, so
+    several AI players can share one cache. With a path, entries are loaded
+    from the file when it exists and written back by save. Saved entries
+    must have (tag, position key, depth) keys and tuples of float values,
+    which are stored as plain binary records.
+    """
+
+    def __init__(self, max_size=100000, path=None):
+        """Create a cache of at most max_size entries."""
+        self.max_size = max_size
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path is not None:
+            self.load(path)
+
+    def __len__(self):
+        """Get the number of entries."""
+        return len(self.entries)
+
+    def __contains__(self, key):
+        """Check the key has an entry, without counting a hit or miss."""
+        return key in self.entries
+
+    def get(self, key, default=None):
+        """Get the value of the key and mark it as recently used."""
+        entries = self.entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Set the value of the key, evicting the least recently used."""
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self):
+        """Get the share of lookups that hit."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def save(self, path=None):
+        """Write the entries to the file, least recently used first."""
+        path = path if path is not None else self.path
+        if path is None:
+            raise Exception("No file to save the evaluation cache to.")
+        parts = [MAGIC, struct.pack("<I", len(self.entries))]
+        for (tag, key, depth), values in self.entries.items():
+            tag = tag.encode()
+            parts.append(ENTRY.pack(len(tag), key, depth, len(values)))
+            parts.append(tag)
+            parts.append(struct.pack(f"<{len(values)}d", *values))
+        write_atomic(path, b"".join(parts))
+
+    def load(self, path):
+        """Add the entries saved in the file, if it exists."""
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        if data[:len(MAGIC)] != MAGIC:
+            raise Exception(f"{path} is not an evaluation cache.")
+        offset = len(MAGIC)
+        (count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        for i in range(count):
+            tag_size, key, depth, num_values = ENTRY.unpack_from(data, offset)
+            offset += ENTRY.size
+            tag = data[offset:offset + tag_size].decode()
+            offset += tag_size
+            values = struct.unpack_from(f"<{num_values}d", data, offset)
+            offset += 8 * num_values
+            self.put((tag, key, depth), values)
+
+
+_shared_cache = None
+
+
+def get_shared_cache():
+    """
+    Get the cache shared by AI players, persisted in the cache directory.
+
+    The cache is loaded on first use and saved when the program exits.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = EvalCache(path=cache_path(FILE_NAME))
+        atexit.register(_shared_cache.save)
+    return _shared_cache
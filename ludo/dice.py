@@ -0,0 +1,62 @@
+"""Dice Package."""
+
+import random
+
+FACES = (1, 2, 3, 4, 5, 6)
+
+
+class RandomDice:
+    """Roll a dice with a random number generator."""
+
+    __slots__ = ("rng",)
+
+    def __init__(self, rng=None):
+        """Create a dice rolled by the given random.Random instance."""
+        self.rng = rng if rng is not None else random.Random()
+
+    def roll(self):
+        """Roll the dice."""
+        return self.rng.randint(1, 6)
+
+
+class BufferedDice:
+    """Roll a dice from blocks of rolls drawn in bulk."""
+
+    __slots__ = ("rng", "block_size", "rolls", "index")
+
+    def __init__(self, rng=None, block_size=4096):
+        """Create a dice drawing blocks of rolls from the random.Random."""
+        self.rng = rng if rng is not None else random.Random()
+        self.block_size = block_size
+        self.rolls = ()
+        self.index = 0
+
+    def roll(self):
+        """Roll the dice, drawing the next block when the block is used."""
+        if self.index == len(self.rolls):
+            self.rolls = self.rng.choices(FACES, k=self.block_size)
+            self.index = 0
+        roll = self.rolls[self.index]
+        self.index += 1
+        return roll
+
+
+class ScriptedDice:
+    """Roll a dice from a given sequence of rolls."""
+
+    __slots__ = ("rolls", "index")
+
+    def __init__(self, rolls):
+        """Create a dice giving the rolls in order."""
+        self.rolls = list(rolls)
+        self.index = 0
+
+    def roll(self):
+        """Roll the dice, failing once the scripted rolls are used up."""
+        if self.index == len(self.rolls):
+            raise Exception(
+                f"Scripted dice ran out after {len(self.rolls)} rolls."
+            )
+        roll = self.rolls[self.index]
+        self.index += 1
+        return roll
@@ -0,0 +1,98 @@
+"""Encoding Package."""
+
+import numpy as np
+
+from ludo.house import PATH_LENGTH
+
+NUM_HOUSES = 4
+NUM_HOUSE_TOKENS = 4
+NUM_TOKENS = NUM_HOUSES * NUM_HOUSE_TOKENS
+NUM_SQUARES = 52
+LAST_TRACK_PROGRESS = 50
+# Features of a token: progress one-hot, in house, safe and threats.
+PROGRESS_FEATURES = PATH_LENGTH
+IN_HOUSE_FEATURE = PROGRESS_FEATURES
+SAFE_FEATURE = IN_HOUSE_FEATURE + 1
+THREATS_FEATURE = SAFE_FEATURE + 1
+TOKEN_SIZE = THREATS_FEATURE + 1
+CURRENT_HOUSE_OFFSET = NUM_TOKENS * TOKEN_SIZE
+ENCODING_SIZE = CURRENT_HOUSE_OFFSET + NUM_HOUSES
+
+
+def threat_count(board, token):
+    """Count the tokens of other houses one roll behind the token."""
+    square = token.current_node.square
+    if square < 0 or token.current_node.is_safe:
+        return 0
+    count = 0
+    for house_index, house in enumerate(board.houses):
+        if house == token.house:
+            continue
+        # Progress of the square for the other house.
+        target = (square - board.start_squares[house_index]) % NUM_SQUARES
+        if target > LAST_TRACK_PROGRESS:
+            continue
+        for other in board.house_tokens[house]:
+            if 1 <= target - other.progress <= 6 and other.progress >= 0:
+                count += 1
+    return count
+
+
+def encode(board, out=None, house_index=None):
+    """
+    Write the fixed layout features of the board into a buffer.
+
+    Tokens come house by house in turn order and by id within a house,
+    each with a one-hot of its progress 0 to 56, an in house flag, a flag
+    for a square no token can be captured on and the number of tokens of
+    other houses one roll behind it. A one-hot of the current house ends
+    the features. With a house index, houses are listed from that house
+    on, so a policy sees the board from its own side. The buffer must be
+    a float array of ENCODING_SIZE values, a new one is made without it.
+    """
+    if out is None:
+        out = np.zeros(ENCODING_SIZE, dtype=np.float32)
+    elif out.shape != (ENCODING_SIZE,):
+        raise Exception(
+            f"Encoding buffer has shape {out.shape}, "
+            f"expected ({ENCODING_SIZE},)."
+        )
+    else:
+        out[:] = 0
+    first = house_index or 0
+    houses = board.houses
+    features = out[:CURRENT_HOUSE_OFFSET].reshape(NUM_TOKENS, TOKEN_SIZE)
+    row = 0
+    for step in range(NUM_HOUSES):
+        house = houses[(first + step) % NUM_HOUSES]
+        for token in board.house_tokens[house]:
+            token_features = features[row]
+            if token.in_house:
+                token_features[IN_HOUSE_FEATURE] = 1
+            else:
+                token_features[token.progress] = 1
+            node = token.current_node
+            if node.is_safe or node.square < 0:
+                token_features[SAFE_FEATURE] = 1
+            token_features[THREATS_FEATURE] = threat_count(board, token)
+            row += 1
+    current = board.house_index(board.current_house)
+    out[CURRENT_HOUSE_OFFSET + (current - first) % NUM_HOUSES] = 1
+    return out
+
+
+def encode_batch(boards, out=None, house_indexes=None):
+    """Encode many boards into the rows of one contiguous array."""
+    if out is None:
+        out = np.zeros((len(boards), ENCODING_SIZE), dtype=np.float32)
+    elif out.shape != (len(boards), ENCODING_SIZE):
+        raise Exception(
+            f"Encoding buffer has shape {out.shape}, "
+            f"expected ({len(boards)}, {ENCODING_SIZE})."
+        )
+    for index, board in enumerate(boards):
+        house_index = None
+        if house_indexes is not None:
+            house_index = house_indexes[index]
+        encode(board, out[index], house_index)
+    return out
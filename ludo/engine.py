@@ -0,0 +1,157 @@
+"""Engine Package."""
+
+import random
+from collections import namedtuple
+
+from ludo.board import Board
+from ludo.dice import BufferedDice
+from ludo.players import Decision, RandomPlayer
+
+
+class TurnResult(
+    namedtuple(
+        "TurnResult", ["house", "roll", "move", "record", "extra_turn"]
+    )
+):
+    """
+    Outcome of a single turn played by the engine.
+
+    The move and its undo record are None when the house had no legal move
+    for the roll. The extra turn flag tells the house rolls again.
+    """
+
+    __slots__ = ()
+
+
+class Engine:
+    """Run the game flow of a board without any user interface."""
+
+    def __init__(
+        self, board=None, rng=None, dice=None, seed=None, players=None
+    ):
+        """
+        Create an engine for the board.
+
+        The rng is a random.Random instance used for token choices and, by
+        default, for dice rolls drawn in blocks. Without an rng the engine
+        seeds its own and keeps the seed, so any game can be replayed
+        exactly. Pass a dice from ludo.dice to script or replace the rolls.
+        Players are ludo.players strategies in turn order, every house
+        chooses at random with the rng by default.
+        """
+        self.board = board if board is not None else Board()
+        if rng is None:
+            if seed is None:
+                seed = random.randrange(2**63)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        self.dice = dice if dice is not None else BufferedDice(rng)
+        if players is None:
+            players = [RandomPlayer(rng)] * len(self.board.houses)
+        self.players = players
+
+    def roll_dice(self):
+        """Roll the dice."""
+        return self.dice.roll()
+
+    def player(self, house):
+        """Get the player of the house."""
+        return self.players[self.board.house_index(house)]
+
+    def choose_move(self, house, roll, moves):
+        """Choose one of the legal moves of the house for the roll."""
+        return self.player(house).choose(self.board, house, roll, moves)
+
+    def start_turn(self, roll=None):
+        """Roll for the current house and get its decision to make."""
+        board = self.board
+        house = board.current_house
+        if roll is None:
+            roll = self.roll_dice()
+        return Decision(board, house, roll, board.legal_moves(house, roll))
+
+    def play_turn(self, roll=None):
+        """
+        Play a turn of the current house.
+
+        A 6 or a capture gives the house another turn, otherwise the turn
+        passes to the next house with tokens left.
+        """
+        decision = self.start_turn(roll)
+        move = None
+        if decision.moves:
+            move = self.choose_move(
+                decision.house, decision.roll, decision.moves
+            )
+        return self.finish_turn(decision, move)
+
+    def finish_turn(self, decision, move):
+        """Make the chosen move of the decision and pass the turn."""
+        board = self.board
+        house = decision.house
+        roll = decision.roll
+        record = None
+        if move is not None:
+            record = board.make_move(move.token.id, roll)
+        extra_turn = roll == 6 or (
+            record is not None and bool(record.captured)
+        )
+        if not extra_turn or house.all_tokens_reached_end():
+            board.extra_turn = False
+            next_house = board.next_unfinished_house(house)
+            if next_house is not None:
+                board.current_house = next_house
+        else:
+            board.extra_turn = True
+        return TurnResult(house, roll, move, record, extra_turn)
+
+    def undo_turn(self, turn, extra_turn):
+        """
+        Take back a turn played by finish_turn.
+
+        The extra turn flag is the board's flag from before the turn.
+        """
+        board = self.board
+        if turn.record is not None:
+            board.unmake_move(turn.record)
+        board.current_house = turn.house
+        board.extra_turn = extra_turn
+
+    def play(self):
+        """Play turns until the game is completed and get the finish order."""
+        board = self.board
+        while not board.completed():
+            self.play_turn()
+        return board.finish_order
+
+
+def play_games(engines):
+    """
+    Play the games of many engines in lockstep until all are completed.
+
+    Each round every unfinished game plays a turn, and the decisions of all
+    games are passed to each player in one choose_batch call.
+    """
+    active = [engine for engine in engines if not engine.board.completed()]
+    while active:
+        decisions = [engine.start_turn() for engine in active]
+        moves = [None] * len(active)
+        # Indexes of the decisions to make by each player.
+        batches = {}
+        for index, (engine, decision) in enumerate(zip(active, decisions)):
+            if decision.moves:
+                player = engine.player(decision.house)
+                batches.setdefault(player, []).append(index)
+        for player, indexes in batches.items():
+            choices = player.choose_batch(
+                [decisions[index] for index in indexes]
+            )
+            for index, move in zip(indexes, choices):
+                moves[index] = move
+        for engine, decision, move in zip(active, decisions, moves):
+            engine.finish_turn(decision, move)
+        active = [
+            engine for engine in active if not engine.board.completed()
+        ]
+    return [engine.board.finish_order for engine in engines]
@@ -0,0 +1,131 @@
+"""Environment Package."""
+
+import random
+
+import numpy as np
+
+from ludo.encoding import ENCODING_SIZE, encode
+from ludo.engine import Engine
+from ludo.players import RandomPlayer
+from ludo.tournament import stream_seed
+
+NUM_HOUSES = 4
+NUM_HOUSE_TOKENS = 4
+NUM_ACTIONS = NUM_HOUSE_TOKENS
+# Board encoding from the agent's side, then a one-hot of the roll.
+OBSERVATION_SIZE = ENCODING_SIZE + 6
+
+
+class VectorEnv:
+    """
+    Step many games at once for training a policy of one house.
+
+    The agent plays the house at agent_index in every game, the other
+    houses are played by the opponent players. Actions are the index of the
+    token to move among the agent's tokens in id order. Observations,
+    rewards, done flags and action masks are NumPy arrays allocated once
+    and filled in place by reset and step. A finished game is reset inside
+    step, so its observation is already the first decision of a new game.
+    The reward of the step finishing a game is 1 for the first place down
+    to -1 for the last, otherwise 0.
+    """
+
+    def __init__(self, num_envs, seed=None, agent_index=0, opponents=None):
+        """Create num_envs games with their own random streams."""
+        if seed is None:
+            seed = random.randrange(2**63)
+        self.num_envs = num_envs
+        self.seed = seed
+        self.agent_index = agent_index
+        self.engines = []
+        for index in range(num_envs):
+            rng = random.Random(stream_seed(seed, index))
+            players = opponents
+            if players is None:
+                players = [RandomPlayer(rng)] * NUM_HOUSES
+            self.engines.append(Engine(rng=rng, players=players))
+        self.initial_state = self.engines[0].board.snapshot()
+        self.decisions = [None] * num_envs
+        self.observations = np.zeros(
+            (num_envs, OBSERVATION_SIZE), dtype=np.float32
+        )
+        self.action_masks = np.zeros((num_envs, NUM_ACTIONS), dtype=bool)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.games = 0
+
+    def reset(self):
+        """Start new games in every environment and get the observations."""
+        for index, engine in enumerate(self.engines):
+            engine.board.restore(self.initial_state)
+            self.advance(index)
+        return self.observations
+
+    def step(self, actions):
+        """
+        Move the chosen token in every game and play to the next decision.
+
+        Returns the observations, rewards, done flags and action masks.
+        """
+        self.rewards[:] = 0
+        self.dones[:] = False
+        for index, engine in enumerate(self.engines):
+            action = int(actions[index])
+            if not self.action_masks[index, action]:
+                raise Exception(f"Action {action} is not legal in {index}.")
+            decision = self.decisions[index]
+            progress = engine.board.house_tokens[decision.house][
+                action
+            ].progress
+            for move in decision.moves:
+                if move.token.progress == progress:
+                    break
+            engine.finish_turn(decision, move)
+            self.advance(index)
+        return self.observations, self.rewards, self.dones, self.action_masks
+
+    def advance(self, index):
+        """Play the game until the agent has a move, resetting at the end."""
+        engine = self.engines[index]
+        board = engine.board
+        agent = board.houses[self.agent_index]
+        while True:
+            if board.completed():
+                self.finish(index)
+                board.restore(self.initial_state)
+            decision = engine.start_turn()
+            if decision.house == agent and decision.moves:
+                break
+            move = None
+            if decision.moves:
+                move = engine.choose_move(
+                    decision.house, decision.roll, decision.moves
+                )
+            engine.finish_turn(decision, move)
+        self.decisions[index] = decision
+        self.observe(index)
+
+    def finish(self, index):
+        """Record the reward of the agent for a completed game."""
+        board = self.engines[index].board
+        places = [board.house_index(house) for house in board.finish_order]
+        place = (
+            places.index(self.agent_index)
+            if self.agent_index in places
+            else NUM_HOUSES - 1
+        )
+        self.rewards[index] = 1 - 2 * place / (NUM_HOUSES - 1)
+        self.dones[index] = True
+        self.games += 1
+
+    def observe(self, index):
+        """Fill the observation and action mask of the agent's decision."""
+        decision = self.decisions[index]
+        board = decision.board
+        observation = self.observations[index]
+        encode(board, observation[:ENCODING_SIZE], self.agent_index)
+        observation[ENCODING_SIZE:] = 0
+        observation[ENCODING_SIZE + decision.roll - 1] = 1
+        mask = self.action_masks[index]
+        for action, token in enumerate(board.house_tokens[decision.house]):
+            mask[action] = token.destination(decision.roll) is not None
@@ -0,0 +1,152 @@
+"""Expectimax Package."""
+
+from ludo.board import Board
+from ludo.cache import EvalCache, get_shared_cache
+from ludo.dice import FACES
+from ludo.engine import Engine
+from ludo.house import PATH_LENGTH
+from ludo.players import Player
+from ludo.symmetry import canonical_key
+from ludo.tablebase import endgame_move
+
+NUM_HOUSES = 4
+NUM_HOUSE_TOKENS = 4
+
+
+def evaluate(board):
+    """
+    Get the heuristic value of the position for each house.
+
+    Values are the share of the path the house's tokens have covered, and
+    a house that finished scores above every house still playing, the
+    earlier finished the higher.
+    """
+    values = [0.0] * NUM_HOUSES
+    finish_order = board.finish_order
+    for house_index, house in enumerate(board.houses):
+        if house in finish_order:
+            place = finish_order.index(house)
+            values[house_index] = 2.0 - place / NUM_HOUSES
+            continue
+        values[house_index] = sum(
+            token.progress + 1 for token in board.house_tokens[house]
+        ) / (PATH_LENGTH * NUM_HOUSE_TOKENS)
+    return values
+
+
+def rotate_values(values, shift):
+    """Renumber values per house so house index shift becomes index 0."""
+    return tuple(
+        values[(house_index + shift) % NUM_HOUSES]
+        for house_index in range(NUM_HOUSES)
+    )
+
+
+class ExpectimaxPlayer(Player):
+    """
+    Choose moves by exact expectimax over the dice rolls.
+
+    Every house maximizes its own value (max^n) and every dice roll counts
+    with the same chance. The search looks depth turns ahead after the
+    move, then evaluates the position. Chance node values are memoized by
+    the canonical key of the position, so rotations of a position share one
+    entry, in the cache given, a private EvalCache of cache_size entries,
+    or by default the shared cache of all players. Rolls without a legal
+    move all pass the turn, and all but a 6 pass it to the same position,
+    so such rolls are searched once and weighted by their number.
+    """
+
+    def __init__(self, depth=2, cache_size=None, cache=None):
+        """Create a player searching depth turns after its move."""
+        self.depth = depth
+        if cache is None:
+            if cache_size is not None:
+                cache = EvalCache(cache_size)
+            else:
+                cache = get_shared_cache()
+        self.cache = cache
+        # Scratch board and engine the search plays on.
+        self.board = Board()
+        self.engine = Engine(self.board, seed=0)
+
+    def choose(self, board, house, roll, moves):
+        """Choose the move with the highest value for the house."""
+        if len(moves) == 1:
+            return moves[0]
+        move = endgame_move(board, house, roll, moves)
+        if move is not None:
+            return move
+        values = self.move_values(board, house, roll, moves)
+        return max(zip(moves, values), key=lambda item: item[1])[0]
+
+    def move_values(self, board, house, roll, moves):
+        """Get the value of each legal move for the house."""
+        self.board.restore(board.snapshot())
+        decision = self.engine.start_turn(roll)
+        house_index = board.house_index(house)
+        values = []
+        for move in decision.moves:
+            values.append(self.after_move(decision, move)[house_index])
+        # Moves of the scratch board map to the given moves by progress.
+        by_progress = {
+            move.token.progress: value
+            for move, value in zip(decision.moves, values)
+        }
+        return [by_progress[move.token.progress] for move in moves]
+
+    def after_move(self, decision, move, depth=None):
+        """Get the values after the decision's move and depth more turns."""
+        if depth is None:
+            depth = self.depth
+        engine = self.engine
+        extra_turn = self.board.extra_turn
+        turn = engine.finish_turn(decision, move)
+        values = self.chance_values(depth)
+        engine.undo_turn(turn, extra_turn)
+        return values
+
+    def chance_values(self, depth):
+        """Get the expected values of the position before the dice roll."""
+        board = self.board
+        if depth == 0 or board.completed():
+            return evaluate(board)
+        # Values are cached in the frame of the house to move.
+        shift = board.house_index(board.current_house)
+        key = ("expectimax", canonical_key(board.snapshot()), depth)
+        values = self.cache.get(key)
+        if values is not None:
+            return rotate_values(values, -shift)
+
+        engine = self.engine
+        totals = [0.0] * NUM_HOUSES
+        # Rolls other than 6 without a legal move lead to one position.
+        num_passes = 0
+        pass_decision = None
+        for roll in FACES:
+            decision = engine.start_turn(roll)
+            if not decision.moves and roll != 6:
+                num_passes += 1
+                pass_decision = decision
+                continue
+            values = self.decision_values(decision, depth)
+            for house_index in range(NUM_HOUSES):
+                totals[house_index] += values[house_index]
+        if num_passes:
+            values = self.after_move(pass_decision, None, depth - 1)
+            for house_index in range(NUM_HOUSES):
+                totals[house_index] += num_passes * values[house_index]
+        values = tuple(total / len(FACES) for total in totals)
+        self.cache.put(key, rotate_values(values, shift))
+        return values
+
+    def decision_values(self, decision, depth):
+        """Get the values of the best move of the decision."""
+        if not decision.moves:
+            return self.after_move(decision, None, depth - 1)
+        house_index = self.board.house_index(decision.house)
+        best = None
+        for move in decision.moves:
+            values = self.after_move(decision, move, depth - 1)
+            if best is None or values[house_index] > best[house_index]:
+                best = values
+        return best
@@ -11,6 +11,10 @@ STAR_NODE_INDEX = 10
 LAST_NODE_INDEX = 12
 FIRST_HOUSE_NODE_INDEX = 13
 END_NODE_INDEX = 18
+# Number of nodes each house contributes to the shared track.
+NUM_TRACK_NODES = 13
+# Length of the path from a house's start node to its end node.
+PATH_LENGTH = 57
 
 
 class HouseType(Enum):
@@ -25,12 +29,35 @@ class HouseType(Enum):
 class House:
     """Represent the Ludo Game House."""
 
+    __slots__ = (
+        "id",
+        "type",
+        "tokens",
+        "home_nodes",
+        "nodes",
+        "house_nodes",
+        "path",
+        "next_house",
+        "board",
+        "num_tokens_reached_end",
+        "ids",
+    )
+
     internal_id = 1  # Class variable
 
-    def __init__(self, type):
-        """Create a House object with the given unique House id."""
-        self.id = House.internal_id
-        House.internal_id += 1
+    def __init__(self, type, ids=None):
+        """
+        Create a House object with the given unique House id.
+
+        Houses of a board take their own, node and token ids from the board's
+        id allocator, other houses take the next process wide ids.
+        """
+        self.ids = ids
+        if ids is None:
+            self.id = House.internal_id
+            House.internal_id += 1
+        else:
+            self.id = ids.house_id()
         # a house_type member which contains the type of house colour.
         self.type = type
         # a house_tokens member which contains the tokens of the house.
@@ -41,10 +68,16 @@ class House:
         self.nodes = []
         # Keep a list of all 5 house nodes only
         self.house_nodes = []
+        # Flat path from start node to end node, filled by build_path.
+        self.path = []
         # Create each house's tokens and nodes.
         self.create_nodes_and_tokens()
         # The next house with tokens in play
         self.next_house = None
+        # The board the house is on, set by the board.
+        self.board = None
+        # Keep a running count of tokens reached end.
+        self.num_tokens_reached_end = 0
 
     def __hash__(self):
         """Uniquely identifiable House object."""
@@ -75,11 +108,43 @@ class House:
 
     def all_tokens_reached_end(self):
         """All Home's tokens reached end."""
+        if self.board is not None:
+            return self.num_tokens_reached_end == len(self.tokens)
         for token in self.tokens:
             if not token.reached_end():
                 return False
         return True
 
+    def token_reached_end(self):
+        """Count a token reached end and tell the board when all did."""
+        self.num_tokens_reached_end += 1
+        if (
+            self.num_tokens_reached_end == len(self.tokens)
+            and self.board is not None
+        ):
+            self.board.house_finished(self)
+
+    def token_left_end(self):
+        """Stop counting a token that was moved away from end."""
+        if (
+            self.num_tokens_reached_end == len(self.tokens)
+            and self.board is not None
+        ):
+            self.board.house_unfinished(self)
+        self.num_tokens_reached_end -= 1
+
+    def new_node(self, node_type=NodeType.REGULAR, house=None):
+        """Create a node with an id from the house's id allocator."""
+        if self.ids is None:
+            return Node(node_type, house)
+        return Node(node_type, house, self.ids.node_id())
+
+    def new_token(self, home_node):
+        """Create a token with an id from the house's id allocator."""
+        if self.ids is None:
+            return Token(home_node)
+        return Token(home_node, self.ids.token_id())
+
     def create_nodes_and_tokens(self):
         """
         Create tokens and nodes. Set every node with next node.
@@ -88,32 +153,32 @@ class House:
         generated 19 nodes link with each other's next node.
         """
         # Create 4 Home nodes for each house.
-        home_node_1 = Node(NodeType.HOME, self)
+        home_node_1 = self.new_node(NodeType.HOME, self)
         self.home_nodes.add(home_node_1)
-        home_node_2 = Node(NodeType.HOME, self)
+        home_node_2 = self.new_node(NodeType.HOME, self)
         self.home_nodes.add(home_node_2)
-        home_node_3 = Node(NodeType.HOME, self)
+        home_node_3 = self.new_node(NodeType.HOME, self)
         self.home_nodes.add(home_node_3)
-        home_node_4 = Node(NodeType.HOME, self)
+        home_node_4 = self.new_node(NodeType.HOME, self)
         self.home_nodes.add(home_node_4)
 
         # Create 4 tokens for each house.
-        Token(home_node_1)
-        Token(home_node_2)
-        Token(home_node_3)
-        Token(home_node_4)
+        self.new_token(home_node_1)
+        self.new_token(home_node_2)
+        self.new_token(home_node_3)
+        self.new_token(home_node_4)
 
         # Keep a running count of nodes created.
         count_nodes = 0
 
         # Add Fork Node for house.
-        self.nodes.append(Node(NodeType.FORK, self))
+        self.nodes.append(self.new_node(NodeType.FORK, self))
         count_nodes += 1
         # Add a Regular Node.
-        self.nodes.append(Node())
+        self.nodes.append(self.new_node())
         count_nodes += 1
         # Add a Start Node for house.
-        self.nodes.append(Node(NodeType.START))
+        self.nodes.append(self.new_node(NodeType.START))
         count_nodes += 1
 
         # Set the next start node for each Home node.
@@ -125,17 +190,17 @@ class House:
         # Make 7 Regular nodes.
         num_regular_nodes_after_start_node = 7
         for i in range(num_regular_nodes_after_start_node):
-            self.nodes.append(Node())
+            self.nodes.append(self.new_node())
         count_nodes += num_regular_nodes_after_start_node
 
         # Add a Star Node.
-        self.nodes.append(Node(NodeType.STAR))
+        self.nodes.append(self.new_node(NodeType.STAR))
         count_nodes += 1
 
         # Add 2 Regular nodes.
         num_regular_nodes_after_star_node = 2
         for i in range(num_regular_nodes_after_star_node):
-            self.nodes.append(Node())
+            self.nodes.append(self.new_node())
         count_nodes += num_regular_nodes_after_star_node
 
         # Set the next node for each node.
@@ -147,14 +212,14 @@ class House:
         # Make every house's 5 House node for reach end.
         num_house_nodes = 5
         for i in range(num_house_nodes):
-            house_node = Node(NodeType.HOUSE, self)
+            house_node = self.new_node(NodeType.HOUSE, self)
             self.nodes.append(house_node)
             self.house_nodes.append(house_node)
         house_node_start_index = count_nodes
         count_nodes += num_house_nodes
 
         # Add an End Node.
-        self.nodes.append(Node(NodeType.END, self))
+        self.nodes.append(self.new_node(NodeType.END, self))
         count_nodes += 1
 
         # Set fork node with next house node.
@@ -168,6 +233,30 @@ class House:
             node_2 = self.nodes[i]
             node_1.next_node = node_2
 
+    def build_path(self):
+        """
+        Build the flat path table followed by the house's tokens.
+
+        The path starts at the start node, walks the shared track up to the
+        house's own fork node and then turns into the house nodes until the
+        end node. Tokens keep their progress as an index into this path, so
+        it must be built once every house is linked with its next house.
+        """
+        path = []
+        node = self.get_start_node()
+        while node is not None and len(path) <= PATH_LENGTH:
+            path.append(node)
+            if node.node_type == NodeType.FORK and node.house == self:
+                node = node.next_house_node
+            else:
+                node = node.next_node
+        if len(path) != PATH_LENGTH:
+            raise Exception(
+                f"House {self.id} {self.type} path has {len(path)} nodes, "
+                f"expected {PATH_LENGTH}."
+            )
+        self.path = path
+
     def get_fork_node(self):
         """Get current house's fork node."""
         return self.nodes[FORK_NODE_INDEX]
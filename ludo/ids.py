@@ -0,0 +1,31 @@
+"""Ids Package."""
+
+
+class IdAllocator:
+    """Hand out node, token and house ids for a single board."""
+
+    __slots__ = ("next_node_id", "next_token_id", "next_house_id")
+
+    def __init__(self):
+        """Start every board with node id 0, token id 1 and house id 1."""
+        self.next_node_id = 0
+        self.next_token_id = 1
+        self.next_house_id = 1
+
+    def node_id(self):
+        """Allocate the next node id."""
+        node_id = self.next_node_id
+        self.next_node_id += 1
+        return node_id
+
+    def token_id(self):
+        """Allocate the next token id."""
+        token_id = self.next_token_id
+        self.next_token_id += 1
+        return token_id
+
+    def house_id(self):
+        """Allocate the next house id."""
+        house_id = self.next_house_id
+        self.next_house_id += 1
+        return house_id
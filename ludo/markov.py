@@ -0,0 +1,142 @@
+"""Markov Package."""
+
+import io
+
+import numpy as np
+
+from ludo.board import Board
+from ludo.house import PATH_LENGTH
+from ludo.storage import cache_path, write_atomic
+
+HOME = -1
+END = PATH_LENGTH - 1
+# States are the progress -1 in house to 56 at end, stored at progress + 1.
+NUM_STATES = PATH_LENGTH + 1
+END_STATE = END + 1
+FILE_NAME = "race.npz"
+
+
+def roll_destinations():
+    """
+    Get the progress a lone token reaches for each progress and roll.
+
+    destinations[progress + 1, roll - 1] is found with Token.destination
+    on a board, so the 6 to leave the house and the exact roll to end
+    follow the engine's rules. A token without a legal move stays.
+    """
+    board = Board()
+    token = board.house_tokens[board.blue_house][0]
+    path = board.blue_house.path
+    destinations = np.zeros((NUM_STATES, 6), dtype=np.intp)
+    for progress in range(HOME, END + 1):
+        token.place(progress)
+        for roll in range(1, 7):
+            node = token.destination(roll)
+            destinations[progress + 1, roll - 1] = (
+                path.index(node) if node is not None else progress
+            )
+    token.place(HOME)
+    return destinations
+
+
+def turn_matrix():
+    """
+    Get the transition matrix of a lone token over one turn.
+
+    A 6 rolls again in the same turn, so with S the roll transitions after
+    a 6 that keep rolling and N those ending the turn, the turn matrix is
+    T = (I - S)^-1 N. Reaching end ends the turn.
+    """
+    destinations = roll_destinations() + 1
+    rolls_again = np.zeros((NUM_STATES, NUM_STATES))
+    ends_turn = np.zeros((NUM_STATES, NUM_STATES))
+    states = np.arange(NUM_STATES)
+    for roll in range(1, 7):
+        after = destinations[:, roll - 1]
+        if roll == 6:
+            again = after != END_STATE
+            np.add.at(rolls_again, (states[again], after[again]), 1 / 6)
+            np.add.at(ends_turn, (states[~again], after[~again]), 1 / 6)
+        else:
+            np.add.at(ends_turn, (states, after), 1 / 6)
+    # The end state is absorbing.
+    rolls_again[END_STATE] = 0
+    ends_turn[END_STATE] = 0
+    ends_turn[END_STATE, END_STATE] = 1
+    return np.linalg.solve(np.eye(NUM_STATES) - rolls_again, ends_turn)
+
+
+def solve(max_turns=500):
+    """
+    Get the expected turns to end and the turn distribution of each state.
+
+    distribution[progress + 1, turns] is the chance a lone token at that
+    progress reaches end in exactly that many turns, for all states at
+    once through powers of the turn matrix. Expected turns come from the
+    fundamental matrix of the transient states.
+    """
+    matrix = turn_matrix()
+    transient = matrix[:END_STATE, :END_STATE]
+    expected = np.zeros(NUM_STATES)
+    expected[:END_STATE] = np.linalg.solve(
+        np.eye(END_STATE) - transient, np.ones(END_STATE)
+    )
+    reached = np.zeros((NUM_STATES, max_turns + 1))
+    power = np.eye(NUM_STATES)
+    reached[:, 0] = power[:, END_STATE]
+    for turns in range(1, max_turns + 1):
+        power = power @ matrix
+        reached[:, turns] = power[:, END_STATE]
+    distribution = np.diff(reached, axis=1, prepend=0.0)
+    return expected, distribution
+
+
+class RaceTable:
+    """
+    Exact race statistics of a lone token at every progress.
+
+    The statistics are solved once and cached as a .npz file in the cache
+    directory, so lookups are plain array reads.
+    """
+
+    def __init__(self, path=None, max_turns=500):
+        """Load the cached statistics, solving them when not cached."""
+        self.path = path if path is not None else cache_path(FILE_NAME)
+        try:
+            with np.load(self.path) as data:
+                self.expected = data["expected"]
+                self.distribution = data["distribution"]
+        except FileNotFoundError:
+            self.expected, self.distribution = solve(max_turns)
+            buffer = io.BytesIO()
+            np.savez(
+                buffer,
+                expected=self.expected,
+                distribution=self.distribution,
+            )
+            write_atomic(self.path, buffer.getvalue())
+        self.cumulative = np.cumsum(self.distribution, axis=1)
+
+    def expected_turns(self, progress):
+        """Get the expected turns of a token at progress to reach end."""
+        return float(self.expected[progress + 1])
+
+    def turn_probabilities(self, progress):
+        """Get the chance to reach end in exactly each number of turns."""
+        return self.distribution[progress + 1]
+
+    def probability_within(self, progress, turns):
+        """Get the chance a token at progress reaches end within turns."""
+        turns = min(turns, self.cumulative.shape[1] - 1)
+        return float(self.cumulative[progress + 1, turns])
+
+
+_race_table = None
+
+
+def get_race_table():
+    """Get the shared race table, loading it on first use."""
+    global _race_table
+    if _race_table is None:
+        _race_table = RaceTable()
+    return _race_table
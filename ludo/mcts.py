@@ -0,0 +1,417 @@
+"""Monte Carlo Tree Search Package."""
+
+import argparse
+import math
+import multiprocessing
+import random
+import time
+
+from ludo.board import Board
+from ludo.dice import RandomDice
+from ludo.engine import Engine
+from ludo.players import Player, RandomPlayer
+from ludo.tablebase import endgame_move
+from ludo.tournament import stream_seed
+
+NUM_HOUSES = 4
+
+
+class SearchNode:
+    """
+    Statistics of a position in the search.
+
+    A position is a chance node: the dice is rolled, then the house to move
+    chooses among its moves. Children are kept per roll as the token
+    progress of each distinct move with the position key it leads to.
+    """
+
+    __slots__ = ("visits", "rewards", "roll_visits", "children")
+
+    def __init__(self):
+        """Create a node without visits."""
+        self.visits = 0
+        # Total reward of each house in turn order.
+        self.rewards = [0.0] * NUM_HOUSES
+        self.roll_visits = [0] * 7
+        self.children = {}
+
+
+class SearchStats:
+    """Counters of the last search of an MCTS player."""
+
+    __slots__ = ("playouts", "elapsed", "nodes")
+
+    def __init__(self, playouts=0, elapsed=0.0, nodes=0):
+        """Create the counters."""
+        self.playouts = playouts
+        self.elapsed = elapsed
+        self.nodes = nodes
+
+    @property
+    def playouts_per_second(self):
+        """Get the playout rate of the search."""
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+
+def rewards(board):
+    """
+    Get the reward of each house of a game.
+
+    Houses score 1 for the first place down to 0 for the last place.
+    Houses still playing are placed after the finished houses by the total
+    progress of their tokens.
+    """
+    places = [board.house_index(house) for house in board.finish_order]
+    playing = [
+        house_index
+        for house_index in range(NUM_HOUSES)
+        if house_index not in places
+    ]
+    playing.sort(
+        key=lambda house_index: -sum(
+            token.progress + 1
+            for token in board.house_tokens[board.houses[house_index]]
+        )
+    )
+    places.extend(playing)
+    result = [0.0] * NUM_HOUSES
+    for place, house_index in enumerate(places):
+        result[house_index] = (NUM_HOUSES - 1 - place) / (NUM_HOUSES - 1)
+    return result
+
+
+class MCTSPlayer(Player):
+    """
+    Choose moves by Monte Carlo tree search over the dice rolls.
+
+    Each playout rolls the dice at every position, picks moves by UCB1 in
+    the tree, adds one new position and plays the game out at random. The
+    search stops after the playout budget or the time limit in seconds,
+    whichever comes first; a budget of None has no limit, but one of them
+    must be set. Positions are stored in a transposition table keyed by
+    Board.position_key, which is kept between moves, so the subtree of the
+    position reached is reused by the next search. Random playouts stop
+    after rollout_turns turns and rank the houses still playing by
+    progress, or play to the end when it is None.
+    """
+
+    def __init__(
+        self,
+        playouts=1000,
+        time_limit=None,
+        exploration=1.4,
+        rng=None,
+        max_nodes=200000,
+        rollout_turns=60,
+    ):
+        """Create a player with its search budget and random stream."""
+        if playouts is None and time_limit is None:
+            raise Exception("MCTS needs a playout budget or a time limit.")
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rng = rng if rng is not None else random.Random()
+        self.max_nodes = max_nodes
+        self.rollout_turns = rollout_turns
+        self.table = {}
+        self.stats = SearchStats()
+        # Scratch board and engine the playouts are played on.
+        self.board = Board()
+        self.engine = Engine(
+            self.board,
+            rng=self.rng,
+            dice=RandomDice(self.rng),
+            players=[RandomPlayer(self.rng)] * NUM_HOUSES,
+        )
+
+    def reset(self):
+        """Forget the transposition table, as before a new game."""
+        self.table = {}
+
+    def choose(self, board, house, roll, moves):
+        """Choose the move visited most by the search."""
+        if len(moves) == 1:
+            return moves[0]
+        move = endgame_move(board, house, roll, moves)
+        if move is not None:
+            return move
+        return best_move(moves, self.root_visits(board.snapshot(), roll))
+
+    def root_visits(self, state, roll):
+        """Search the state and get the visits of each root move."""
+        if len(self.table) > self.max_nodes:
+            self.table = {}
+        root_key = self.search(state, roll)
+        return {
+            progress: self.visits(key)
+            for progress, key in self.table[root_key].children[roll]
+        }
+
+    def search(self, state, roll):
+        """Run playouts from the state with the rolled dice."""
+        start = time.perf_counter()
+        deadline = None
+        if self.time_limit is not None:
+            deadline = start + self.time_limit
+        self.board.restore(state)
+        root_key = self.board.position_key
+        root = self.table.get(root_key)
+        if root is None:
+            root = self.table[root_key] = SearchNode()
+        if roll not in root.children:
+            root.children[roll] = self.expand(self.engine.start_turn(roll))
+        playouts = 0
+        while self.playouts is None or playouts < self.playouts:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self.board.restore(state)
+            self.playout(roll)
+            playouts += 1
+        self.stats = SearchStats(
+            playouts, time.perf_counter() - start, len(self.table)
+        )
+        return root_key
+
+    def visits(self, key):
+        """Get the visits of the position, 0 when not in the table."""
+        node = self.table.get(key)
+        return node.visits if node is not None else 0
+
+    def playout(self, roll):
+        """Play one playout from the scratch board, rolling after the root."""
+        board = self.board
+        engine = self.engine
+        path = []
+        while not board.completed():
+            key = board.position_key
+            node = self.table.get(key)
+            if node is None:
+                node = self.table[key] = SearchNode()
+                path.append(node)
+                self.rollout()
+                break
+            path.append(node)
+            if roll is None:
+                roll = engine.roll_dice()
+            decision = engine.start_turn(roll)
+            node.roll_visits[roll] += 1
+            move = None
+            if decision.moves:
+                move = self.select(node, decision)
+            engine.finish_turn(decision, move)
+            roll = None
+        result = rewards(board)
+        for node in path:
+            node.visits += 1
+            node_rewards = node.rewards
+            for house_index in range(NUM_HOUSES):
+                node_rewards[house_index] += result[house_index]
+
+    def rollout(self):
+        """Play random turns from the scratch board."""
+        board = self.board
+        engine = self.engine
+        if self.rollout_turns is None:
+            engine.play()
+            return
+        for turn in range(self.rollout_turns):
+            if board.completed():
+                break
+            engine.play_turn()
+
+    def select(self, node, decision):
+        """Choose the move of the decision in the tree by UCB1."""
+        moves = decision.moves
+        if len(moves) == 1:
+            return moves[0]
+        children = node.children.get(decision.roll)
+        if children is None:
+            children = node.children[decision.roll] = self.expand(decision)
+        house_index = self.board.house_index(decision.house)
+        log_visits = math.log(node.roll_visits[decision.roll])
+        best_move = None
+        best_score = -1.0
+        for move, (progress, key) in zip(moves, children):
+            child = self.table.get(key)
+            if child is None or not child.visits:
+                return move
+            score = child.rewards[house_index] / child.visits + (
+                self.exploration * math.sqrt(log_visits / child.visits)
+            )
+            if score > best_score:
+                best_move = move
+                best_score = score
+        return best_move
+
+    def expand(self, decision):
+        """Get the token progress and position key after each move."""
+        board = self.board
+        engine = self.engine
+        extra_turn = board.extra_turn
+        children = []
+        for move in decision.moves:
+            progress = move.token.progress
+            turn = engine.finish_turn(decision, move)
+            children.append((progress, board.position_key))
+            engine.undo_turn(turn, extra_turn)
+        return children
+
+
+def best_move(moves, visits):
+    """Get the move whose token progress has the most root visits."""
+    best = max(visits, key=visits.get)
+    for move in moves:
+        if move.token.progress == best:
+            return move
+    raise Exception(f"No legal move from progress {best}.")
+
+
+# Players of a worker process by task index, kept between searches to
+# reuse their tables.
+_worker_players = {}
+
+
+def search_root(player, state, roll, seed):
+    """Search a root position with the player reseeded, get root visits."""
+    player.rng.seed(seed)
+    visits = player.root_visits(state, roll)
+    return visits, player.stats.playouts
+
+
+def _search_root(args):
+    """
+    Search a root position with the worker's player of the task index.
+
+    A pool may hand several tasks of one search to the same worker, so each
+    task index searches with its own player and table, and the root visits
+    of one task are never counted again in another.
+    """
+    index, state, roll, seed, options = args
+    player = _worker_players.get(index)
+    if player is None:
+        player = _worker_players[index] = MCTSPlayer(**options)
+    return search_root(player, state, roll, seed)
+
+
+class RootParallelMCTSPlayer(Player):
+    """
+    Run independent MCTS searches of the same position across processes.
+
+    Every process searches with its own random stream and table under the
+    same playout and time budget, then the root visits of each move are
+    summed and the most visited move is chosen. The pool is started on the
+    first search; call close when done with the player.
+    """
+
+    def __init__(self, processes=None, seed=None, **options):
+        """Create a player searching in processes with MCTSPlayer options."""
+        self.processes = processes or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2**63)
+        self.options = options
+        self.searches = 0
+        self.stats = SearchStats()
+        self.pool = None
+        # Player searching in this process when there is one process.
+        self.player = None
+
+    def choose(self, board, house, roll, moves):
+        """Choose the move with the most root visits of all searches."""
+        if len(moves) == 1:
+            return moves[0]
+        move = endgame_move(board, house, roll, moves)
+        if move is not None:
+            return move
+        start = time.perf_counter()
+        state = board.snapshot()
+        tasks = [
+            (
+                index,
+                state,
+                roll,
+                stream_seed(self.seed, self.searches * self.processes + index),
+                self.options,
+            )
+            for index in range(self.processes)
+        ]
+        self.searches += 1
+        if self.processes == 1:
+            if self.player is None:
+                self.player = MCTSPlayer(**self.options)
+            results = [search_root(self.player, *task[1:4]) for task in tasks]
+        else:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(self.processes)
+            results = self.pool.map(_search_root, tasks, chunksize=1)
+        visits = {}
+        playouts = 0
+        for root_visits, search_playouts in results:
+            playouts += search_playouts
+            for progress, count in root_visits.items():
+                visits[progress] = visits.get(progress, 0) + count
+        self.stats = SearchStats(playouts, time.perf_counter() - start)
+        return best_move(moves, visits)
+
+    def close(self):
+        """Stop the process pool."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+def main(argv=None):
+    """Play a game with MCTS players and report their playout rate."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ludo.mcts", description=main.__doc__
+    )
+    parser.add_argument(
+        "--playouts",
+        type=int,
+        default=None,
+        help="playouts per search, 200 unless searching by --time",
+    )
+    parser.add_argument("--time", type=float, default=None)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="search root parallel in this many processes",
+    )
+    args = parser.parse_args(argv)
+    if args.playouts is None and args.time is None:
+        args.playouts = 200
+
+    rng = random.Random(args.seed)
+    if args.processes > 1:
+        player = RootParallelMCTSPlayer(
+            args.processes,
+            args.seed,
+            playouts=args.playouts,
+            time_limit=args.time,
+        )
+    else:
+        player = MCTSPlayer(args.playouts, args.time, rng=rng)
+    engine = Engine(rng=rng, players=[player] * NUM_HOUSES)
+    playouts = 0
+    elapsed = 0.0
+    searches = 0
+    while searches < args.moves and not engine.board.completed():
+        player.stats = SearchStats()
+        engine.play_turn()
+        if player.stats.playouts:
+            searches += 1
+            playouts += player.stats.playouts
+            elapsed += player.stats.elapsed
+    if args.processes > 1:
+        player.close()
+    rate = playouts / elapsed if elapsed else 0.0
+    print(
+        f"{searches} searches, {playouts} playouts in {elapsed:.2f}s, "
+        f"{rate:.0f} playouts per second"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,13 +15,33 @@ class NodeType(Enum):
     FORK = "fork"
 
 
+# Shared by every node without tokens, its set is created on first use.
+EMPTY_TOKENS = frozenset()
+
+
 class Node:
     """Represent Ludo Game Node(Step)."""
 
+    __slots__ = (
+        "id",
+        "next_node",
+        "node_type",
+        "is_safe",
+        "_tokens",
+        "house",
+        "next_house_node",
+        "square",
+    )
+
     internal_id = 0  # Class variable
 
-    def __init__(self, node_type=NodeType.REGULAR, house=None):
-        """Represent unique node id."""
+    def __init__(self, node_type=NodeType.REGULAR, house=None, node_id=None):
+        """
+        Represent unique node id.
+
+        Nodes of a board get their id from the board, other nodes take the
+        next process wide id.
+        """
         if (
             node_type == NodeType.HOME
             or node_type == NodeType.HOUSE
@@ -29,8 +49,10 @@ class Node:
             or node_type == NodeType.END
         ) and house is None:
             raise Exception(f"Cannot create {node_type} node without house.")
-        self.id = Node.internal_id
-        Node.internal_id += 1
+        if node_id is None:
+            node_id = Node.internal_id
+            Node.internal_id += 1
+        self.id = node_id
         # Pointing Node member to next Node.
         self.next_node = None
         # Pointing Node member to which type of Node.
@@ -39,12 +61,14 @@ class Node:
         self.is_safe = (
             node_type != NodeType.REGULAR and node_type != NodeType.FORK
         )
-        # Represents the unique tokens set.
-        self.tokens = set()
+        # Represents the unique tokens set, None while the node is empty.
+        self._tokens = None
         # Represents the House's node.
         self.house = house
         # Pointing Node member to House node.
         self.next_house_node = None
+        # Square index on a board's shared track, -1 when not on the track.
+        self.square = -1
 
     def __hash__(self):
         """Uniquely identifiable Node object."""
@@ -65,11 +89,20 @@ class Node:
         """Uniquely identifiable string representation of Node object."""
         return f"Node_Id: {self.id}\n"
 
+    @property
+    def tokens(self):
+        """Get the tokens on the node."""
+        if self._tokens is None:
+            return EMPTY_TOKENS
+        return self._tokens
+
     def add_token(self, token):
         """Add the unique current token."""
+        if self._tokens is None:
+            self._tokens = set()
         if self.node_type == NodeType.HOME:
-            if len(self.tokens) == 0:
-                self.tokens.add(token)
+            if len(self._tokens) == 0:
+                self._tokens.add(token)
                 return
             raise Exception(
                 f"Attempt to add token {token.id} "
@@ -78,7 +111,7 @@ class Node:
             )
         elif self.node_type == NodeType.HOUSE:
             if token.house == self.house:
-                self.tokens.add(token)
+                self._tokens.add(token)
                 return
             raise Exception(
                 f"Attempt to add token {token.id} "
@@ -86,11 +119,15 @@ class Node:
                 f"{self.house.type}."
             )
         else:
-            self.tokens.add(token)
+            self._tokens.add(token)
 
     def remove_token(self, old_token):
         """Remove the unique old token."""
-        self.tokens.remove(old_token)
+        if self._tokens is None:
+            raise KeyError(old_token)
+        self._tokens.remove(old_token)
+        if not self._tokens:
+            self._tokens = None
 
     def has_n_next_nodes(self, n):
         """Check 'n' times node has next node."""
@@ -0,0 +1,115 @@
+"""Players Package."""
+
+import random
+from collections import namedtuple
+
+
+class Decision(namedtuple("Decision", ["board", "house", "roll", "moves"])):
+    """A choice a player makes among the legal moves of the house."""
+
+    __slots__ = ()
+
+
+class Player:
+    """
+    Strategy choosing the move of a house.
+
+    Subclasses implement choose. Strategies that gain from seeing many
+    decisions at once, such as vectorized or cached policies, override
+    choose_batch as well.
+    """
+
+    __slots__ = ()
+
+    def choose(self, board, house, roll, moves):
+        """Choose one of the legal moves of the house for the roll."""
+        raise NotImplementedError
+
+    def choose_batch(self, decisions):
+        """Choose a move for each decision, in order."""
+        return [self.choose(*decision) for decision in decisions]
+
+
+class RandomPlayer(Player):
+    """Choose uniformly among the legal moves."""
+
+    __slots__ = ("rng",)
+
+    def __init__(self, rng=None):
+        """Create a player choosing with the given random.Random instance."""
+        self.rng = rng if rng is not None else random.Random()
+
+    def choose(self, board, house, roll, moves):
+        """Choose a random move."""
+        return moves[self.rng.randrange(len(moves))]
+
+
+def advance(move, roll):
+    """Get the path index the move ends on, 0 for leaving the house."""
+    if move.token.in_house:
+        return 0
+    return move.token.progress + roll
+
+
+class GreedyPlayer(Player):
+    """Advance the token that gets furthest along its path."""
+
+    __slots__ = ()
+
+    def choose(self, board, house, roll, moves):
+        """Choose the move ending furthest along the path."""
+        return max(moves, key=lambda move: advance(move, roll))
+
+
+class CaptureFirstPlayer(Player):
+    """Capture whenever possible, otherwise play greedily."""
+
+    __slots__ = ()
+
+    def choose(self, board, house, roll, moves):
+        """Choose the move capturing most tokens, then the furthest one."""
+        return max(
+            moves, key=lambda move: (len(move.captures), advance(move, roll))
+        )
+
+
+class SafeSquarePlayer(Player):
+    """Prefer moves ending where no other house can capture the token."""
+
+    __slots__ = ()
+
+    def choose(self, board, house, roll, moves):
+        """Choose a safe move ending furthest, or the furthest move."""
+        threats = board.threat_mask(house)
+
+        def is_safe(move):
+            square = move.destination.square
+            return (
+                move.destination.is_safe
+                or square < 0
+                or not threats >> square & 1
+            )
+
+        return max(
+            moves, key=lambda move: (is_safe(move), advance(move, roll))
+        )
+
+
+# Built-in players by name.
+PLAYERS = {
+    "random": RandomPlayer,
+    "greedy": GreedyPlayer,
+    "capture": CaptureFirstPlayer,
+    "safe": SafeSquarePlayer,
+}
+
+
+def make_player(name, rng=None):
+    """Create a built-in player by name."""
+    if name not in PLAYERS:
+        raise Exception(
+            f"Unknown player {name}, choose from {', '.join(PLAYERS)}."
+        )
+    if name == "random":
+        return RandomPlayer(rng)
+    return PLAYERS[name]()
@@ -0,0 +1,244 @@
+"""Self-Play Package."""
+
+import argparse
+import io
+import multiprocessing
+import os
+import random
+import re
+import time
+
+import numpy as np
+
+from ludo.encoding import ENCODING_SIZE, encode
+from ludo.engine import Engine
+from ludo.players import PLAYERS, make_player
+from ludo.storage import write_atomic
+from ludo.tournament import stream_seed
+
+NUM_HOUSES = 4
+SHARD_PATTERN = re.compile(r"shard-(\d+)\.npz")
+
+
+def outcomes(board):
+    """Get the outcome of each house, 1 for first place down to -1 last."""
+    places = [board.house_index(house) for house in board.finish_order]
+    for house_index in range(NUM_HOUSES):
+        if house_index not in places:
+            places.append(house_index)
+    result = [0.0] * NUM_HOUSES
+    for place, house_index in enumerate(places):
+        result[house_index] = 1 - 2 * place / (NUM_HOUSES - 1)
+    return result
+
+
+def play_game(engine):
+    """
+    Play a game and get its samples as arrays.
+
+    Every decision with a choice is a sample of the board encoded from the
+    deciding house's side, the roll, the house and the index of the chosen
+    token. Outcomes of the deciding house are filled in once the game ends.
+    """
+    board = engine.board
+    buffer = np.zeros(ENCODING_SIZE, dtype=np.float32)
+    states = []
+    rolls = []
+    houses = []
+    actions = []
+    while not board.completed():
+        decision = engine.start_turn()
+        move = None
+        if decision.moves:
+            move = engine.choose_move(
+                decision.house, decision.roll, decision.moves
+            )
+        if len(decision.moves) > 1:
+            house_index = board.house_index(decision.house)
+            encode(board, buffer, house_index)
+            states.append(buffer.astype(np.uint8))
+            rolls.append(decision.roll)
+            houses.append(house_index)
+            tokens = board.house_tokens[decision.house]
+            actions.append(tokens.index(move.token))
+        engine.finish_turn(decision, move)
+    house_outcomes = outcomes(board)
+    return {
+        "states": np.array(states, dtype=np.uint8).reshape(
+            -1, ENCODING_SIZE
+        ),
+        "rolls": np.array(rolls, dtype=np.uint8),
+        "houses": np.array(houses, dtype=np.uint8),
+        "actions": np.array(actions, dtype=np.uint8),
+        "outcomes": np.array(
+            [house_outcomes[house_index] for house_index in houses],
+            dtype=np.float32,
+        ),
+    }
+
+
+def worker(seed, stream, num_games, player, queue):
+    """Play games on a random stream and put their samples on the queue."""
+    try:
+        rng = random.Random(stream_seed(seed, stream))
+        players = [make_player(player, rng)] * NUM_HOUSES
+        for i in range(num_games):
+            engine = Engine(rng=rng, players=players)
+            queue.put(play_game(engine))
+    finally:
+        # Tell the writer this worker is done, even when it failed.
+        queue.put(None)
+
+
+class ShardWriter:
+    """
+    Collect samples into fixed size shards written as compressed .npz files.
+
+    Shard arrays are allocated once, so memory stays the same however many
+    samples are written. Shards are numbered on after the shards already in
+    the directory, so a new run adds to them instead of overwriting them.
+    """
+
+    def __init__(self, directory, shard_size):
+        """Create a writer of shards of shard_size samples."""
+        self.directory = directory
+        self.shard_size = shard_size
+        os.makedirs(directory, exist_ok=True)
+        self.arrays = {
+            "states": np.zeros((shard_size, ENCODING_SIZE), dtype=np.uint8),
+            "rolls": np.zeros(shard_size, dtype=np.uint8),
+            "houses": np.zeros(shard_size, dtype=np.uint8),
+            "actions": np.zeros(shard_size, dtype=np.uint8),
+            "outcomes": np.zeros(shard_size, dtype=np.float32),
+        }
+        self.size = 0
+        self.paths = []
+        self.samples = 0
+        self.next_shard = 0
+        for name in os.listdir(directory):
+            match = SHARD_PATTERN.fullmatch(name)
+            if match:
+                self.next_shard = max(self.next_shard, int(match[1]) + 1)
+
+    def add(self, samples):
+        """Add the samples of a game, writing every shard that fills up."""
+        num_samples = len(samples["rolls"])
+        start = 0
+        while start < num_samples:
+            count = min(num_samples - start, self.shard_size - self.size)
+            for name, array in self.arrays.items():
+                array[self.size:self.size + count] = samples[name][
+                    start:start + count
+                ]
+            self.size += count
+            start += count
+            if self.size == self.shard_size:
+                self.flush()
+        self.samples += num_samples
+
+    def flush(self):
+        """Write the samples collected so far as a shard."""
+        if not self.size:
+            return
+        path = os.path.join(self.directory, f"shard-{self.next_shard:05d}.npz")
+        buffer = io.BytesIO()
+        arrays = {
+            name: array[:self.size] for name, array in self.arrays.items()
+        }
+        np.savez_compressed(buffer, **arrays)
+        write_atomic(path, buffer.getvalue())
+        self.paths.append(path)
+        self.next_shard += 1
+        self.size = 0
+
+
+def run_selfplay(
+    num_games,
+    directory,
+    seed=0,
+    processes=None,
+    shard_size=100000,
+    player="random",
+    queue_size=64,
+):
+    """
+    Play games in worker processes and stream their samples into shards.
+
+    Workers put the samples of each finished game on a bounded queue while
+    this process writes shards, so writing overlaps with simulation and a
+    slow writer holds the workers back instead of filling memory.
+    """
+    processes = processes or multiprocessing.cpu_count()
+    processes = max(1, min(processes, num_games))
+    queue = multiprocessing.Queue(queue_size)
+    workers = []
+    for stream in range(processes):
+        worker_games = num_games // processes + (
+            stream < num_games % processes
+        )
+        workers.append(
+            multiprocessing.Process(
+                target=worker,
+                args=(seed, stream, worker_games, player, queue),
+            )
+        )
+    for process in workers:
+        process.start()
+    writer = ShardWriter(directory, shard_size)
+    running = len(workers)
+    try:
+        while running:
+            samples = queue.get()
+            if samples is None:
+                running -= 1
+                continue
+            writer.add(samples)
+        writer.flush()
+    except BaseException:
+        # Workers blocked on the full queue would never exit, stop them.
+        for process in workers:
+            process.terminate()
+        raise
+    finally:
+        for process in workers:
+            process.join()
+    for process in workers:
+        if process.exitcode:
+            raise Exception(
+                f"Self-play worker failed with exit code {process.exitcode}."
+            )
+    return writer
+
+
+def main(argv=None):
+    """Generate self-play shards and report samples per second."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ludo.selfplay", description=main.__doc__
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--out", default="selfplay")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=100000)
+    parser.add_argument("--player", choices=list(PLAYERS), default="random")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    writer = run_selfplay(
+        args.games,
+        args.out,
+        args.seed,
+        args.processes,
+        args.shard_size,
+        args.player,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.games} games, {writer.samples} samples in "
+        f"{len(writer.paths)} shards in {elapsed:.2f}s, "
+        f"{writer.samples / elapsed:.0f} samples per second"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Simulate Package."""
+
+import argparse
+import random
+import time
+
+from ludo.board import Board
+from ludo.engine import Engine
+from ludo.players import PLAYERS, make_player
+
+NUM_HOUSES = 4
+
+
+def simulate(num_games, seed=None, players=None):
+    """
+    Play games headless and get the number of wins of each house.
+
+    Players are the names of the built-in players of the houses in turn
+    order, every house plays at random by default.
+    """
+    rng = random.Random(seed)
+    if players is not None:
+        players = [make_player(name, rng) for name in players]
+    wins = {}
+    for i in range(num_games):
+        engine = Engine(rng=rng, players=players)
+        winner_house = engine.play()[0]
+        wins[winner_house.type] = wins.get(winner_house.type, 0) + 1
+    return wins
+
+
+def simulate_vector(num_games, seed=None):
+    """Play games in lockstep with NumPy and get the wins of each house."""
+    from ludo.vector import VectorGames
+
+    winners = VectorGames(num_games, seed).run()
+    house_types = [house.type for house in Board().houses]
+    wins = {}
+    for house_index, house_type in enumerate(house_types):
+        num_wins = int((winners == house_index).sum())
+        if num_wins:
+            wins[house_type] = num_wins
+    return wins
+
+
+def main(argv=None):
+    """Run simulated games and report the games played per second."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ludo.simulate", description=main.__doc__
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--backend", choices=["object", "vector"], default="object"
+    )
+    parser.add_argument(
+        "--players",
+        default=None,
+        help="comma separated players of the houses in turn order, "
+        f"from {', '.join(PLAYERS)}",
+    )
+    args = parser.parse_args(argv)
+    players = None
+    if args.players is not None:
+        players = args.players.split(",")
+        if len(players) == 1:
+            players *= NUM_HOUSES
+        if len(players) != NUM_HOUSES:
+            parser.error(f"--players needs 1 or {NUM_HOUSES} players")
+        for name in players:
+            if name not in PLAYERS:
+                parser.error(f"unknown player {name}")
+        if args.backend == "vector":
+            parser.error("the vector backend only plays random players")
+
+    start = time.perf_counter()
+    if args.backend == "vector":
+        wins = simulate_vector(args.games, args.seed)
+    else:
+        wins = simulate(args.games, args.seed, players)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.games} games in {elapsed:.2f}s, "
+        f"{args.games / elapsed:.0f} games per second"
+    )
+    for house_type, num_wins in sorted(
+        wins.items(), key=lambda item: item[0].value
+    ):
+        print(f"{house_type.value}: {num_wins} wins")
+
+
+if __name__ == "__main__":
+    main()
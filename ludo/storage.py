@@ -0,0 +1,28 @@
+"""Storage Package."""
+
+import os
+
+# Environment variable overriding the cache directory.
+CACHE_DIR_VARIABLE = "LUDO_CACHE_DIR"
+
+
+def cache_dir():
+    """Get the directory of generated data files, creating it if needed."""
+    path = os.environ.get(CACHE_DIR_VARIABLE)
+    if not path:
+        path = os.path.join(os.path.expanduser("~"), ".cache", "ludo")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_path(name):
+    """Get the path of a data file in the cache directory."""
+    return os.path.join(cache_dir(), name)
+
+
+def write_atomic(path, data):
+    """Write bytes to a file so readers never see a partial file."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
@@ -0,0 +1,78 @@
+"""Symmetry Package."""
+
+from ludo.board import (
+    EXTRA_TURN_KEY,
+    HOUSE_KEYS,
+    TOKEN_KEYS,
+    BoardState,
+)
+
+NUM_HOUSES = 4
+NUM_HOUSE_TOKENS = 4
+
+
+def rotate_state(state, shift):
+    """
+    Rotate a board state so house index shift becomes house index 0.
+
+    Token progress is relative to each house's own start node and the
+    houses are spaced evenly around the track, so rotating only renumbers
+    the houses.
+    """
+    shift %= NUM_HOUSES
+
+    def rotate(index):
+        return (index - shift) % NUM_HOUSES
+
+    progress = []
+    in_house = []
+    for house_index in range(NUM_HOUSES):
+        begin = ((house_index + shift) % NUM_HOUSES) * NUM_HOUSE_TOKENS
+        progress.extend(state.progress[begin:begin + NUM_HOUSE_TOKENS])
+        in_house.extend(state.in_house[begin:begin + NUM_HOUSE_TOKENS])
+    return BoardState(
+        tuple(progress),
+        tuple(in_house),
+        rotate(state.current_house),
+        tuple(
+            rotate(state.next_houses[(house_index + shift) % NUM_HOUSES])
+            for house_index in range(NUM_HOUSES)
+        ),
+        tuple(rotate(index) for index in state.finish_order),
+        state.extra_turn,
+    )
+
+
+def canonical_state(state):
+    """
+    Get the canonical form of a board state.
+
+    The state is rotated so the current house is house index 0, and the
+    tokens of each house are sorted by progress since tokens of a house are
+    interchangeable. All four rotations of a position, and any relabelling
+    of a house's tokens, share one canonical state.
+    """
+    state = rotate_state(state, state.current_house)
+    progress = []
+    for begin in range(0, NUM_HOUSES * NUM_HOUSE_TOKENS, NUM_HOUSE_TOKENS):
+        progress.extend(sorted(state.progress[begin:begin + NUM_HOUSE_TOKENS]))
+    return state._replace(
+        progress=tuple(progress),
+        in_house=tuple(p < 0 for p in progress),
+    )
+
+
+def canonical_key(state):
+    """
+    Get the Zobrist hash of the canonical form of a board state.
+
+    The key is the Board.position_key of the canonical state, so every
+    rotation and token relabelling of a position shares one key.
+    """
+    state = canonical_state(state)
+    key = HOUSE_KEYS[state.current_house]
+    if state.extra_turn:
+        key ^= EXTRA_TURN_KEY
+    for index, progress in enumerate(state.progress):
+        key ^= TOKEN_KEYS[index][progress + 1]
+    return key
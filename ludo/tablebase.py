@@ -0,0 +1,165 @@
+"""Tablebase Package."""
+
+import mmap
+import os
+import struct
+
+from ludo.house import PATH_LENGTH
+from ludo.storage import cache_path, write_atomic
+
+NUM_HOUSE_TOKENS = 4
+# First path index of the house nodes, tokens there can not be captured.
+FIRST_LANE_PROGRESS = 51
+END_PROGRESS = PATH_LENGTH - 1
+NUM_LANE_NODES = END_PROGRESS - FIRST_LANE_PROGRESS + 1
+NUM_POSITIONS = NUM_LANE_NODES**NUM_HOUSE_TOKENS
+NUM_ROLLS = 6
+# Header of the table files, older versions are rebuilt.
+MAGIC_PREFIX = b"LUDOTB"
+MAGIC = MAGIC_PREFIX + b"2\0"
+FILE_NAME = "endgame.tb"
+# Best move byte of a roll without a legal move.
+NO_MOVE = 0
+
+
+def position_index(progress):
+    """Get the table index of the tokens' progress on the house nodes."""
+    index = 0
+    for token_progress in progress:
+        index = index * NUM_LANE_NODES + token_progress - FIRST_LANE_PROGRESS
+    return index
+
+
+def index_progress(index):
+    """Get the tokens' progress of a table index."""
+    progress = []
+    for i in range(NUM_HOUSE_TOKENS):
+        index, lane = divmod(index, NUM_LANE_NODES)
+        progress.append(lane + FIRST_LANE_PROGRESS)
+    return tuple(reversed(progress))
+
+
+def build():
+    """
+    Compute the expected turns to finish and the best move of every roll.
+
+    A 6 never moves on the house nodes and rolls again in the same turn,
+    so a turn ends with one of the rolls 1 to 5. With k of them having no
+    move, E = (5 + sum of the best E after each movable roll) / (5 - k).
+    Moves only add progress, so positions are solved from the most
+    advanced down.
+    """
+    expected = [0.0] * NUM_POSITIONS
+    best_moves = bytearray(NUM_POSITIONS * NUM_ROLLS)
+    order = sorted(range(NUM_POSITIONS), key=lambda i: -sum(index_progress(i)))
+    for index in order:
+        progress = index_progress(index)
+        if all(p == END_PROGRESS for p in progress):
+            continue
+        # The 6 is always blocked, so it leaves 5 - k rolls ending a turn.
+        total = float(NUM_ROLLS - 1)
+        num_blocked = 0
+        for roll in range(1, NUM_ROLLS + 1):
+            best = None
+            for token_index, token_progress in enumerate(progress):
+                if (
+                    token_progress == END_PROGRESS
+                    or token_progress + roll > END_PROGRESS
+                ):
+                    continue
+                after = list(progress)
+                after[token_index] += roll
+                value = expected[position_index(after)]
+                if best is None or value < best[0]:
+                    best = (value, token_progress)
+            if best is None:
+                num_blocked += 1
+                continue
+            total += best[0]
+            best_moves[index * NUM_ROLLS + roll - 1] = best[1]
+        expected[index] = total / (NUM_ROLLS - num_blocked)
+    return expected, best_moves
+
+
+def encode(expected, best_moves):
+    """Get the binary file contents of the table."""
+    return (
+        MAGIC
+        + struct.pack(f"<{NUM_POSITIONS}d", *expected)
+        + bytes(best_moves)
+    )
+
+
+class Tablebase:
+    """
+    Endgame table of a house whose tokens are all on the house nodes.
+
+    From there a house no longer meets other houses, only the exact roll
+    to end matters. The table holds the expected number of turns to get
+    every token to end and the best token to move for each roll. It reads
+    from a memory mapped file, built on first use in the cache directory
+    and rebuilt when written by an older version.
+    """
+
+    def __init__(self, path=None):
+        """Open the table file, building it when it does not exist."""
+        self.path = path if path is not None else cache_path(FILE_NAME)
+        if not os.path.exists(self.path):
+            write_atomic(self.path, encode(*build()))
+        self.data = self.map()
+        if self.data[:len(MAGIC)] != MAGIC:
+            if self.data[:len(MAGIC_PREFIX)] != MAGIC_PREFIX:
+                self.data.close()
+                raise Exception(f"{self.path} is not an endgame tablebase.")
+            self.data.close()
+            write_atomic(self.path, encode(*build()))
+            self.data = self.map()
+        self.moves_offset = len(MAGIC) + NUM_POSITIONS * 8
+
+    def map(self):
+        """Memory map the table file."""
+        with open(self.path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def covers(progress):
+        """Check every token is on the house nodes or at end."""
+        return all(p >= FIRST_LANE_PROGRESS for p in progress)
+
+    def expected_turns(self, progress):
+        """Get the expected turns to get every token to end."""
+        offset = len(MAGIC) + position_index(progress) * 8
+        return struct.unpack_from("<d", self.data, offset)[0]
+
+    def best_move(self, progress, roll):
+        """Get the progress of the token to move for the roll, or None."""
+        offset = self.moves_offset + position_index(progress) * NUM_ROLLS
+        token_progress = self.data[offset + roll - 1]
+        return token_progress if token_progress != NO_MOVE else None
+
+    def close(self):
+        """Close the memory map."""
+        self.data.close()
+
+
+_tablebase = None
+
+
+def get_tablebase():
+    """Get the shared tablebase, opening it on first use."""
+    global _tablebase
+    if _tablebase is None:
+        _tablebase = Tablebase()
+    return _tablebase
+
+
+def endgame_move(board, house, roll, moves):
+    """Get the tablebase move when the house is in the endgame, or None."""
+    progress = [token.progress for token in board.house_tokens[house]]
+    if not Tablebase.covers(progress):
+        return None
+    token_progress = get_tablebase().best_move(progress, roll)
+    for move in moves:
+        if move.token.progress == token_progress:
+            return move
+    return None
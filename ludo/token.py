@@ -6,31 +6,52 @@ from ludo.node import NodeType
 class Token:
     """Represent Ludo Game Token(Player's Coin)."""
 
+    __slots__ = (
+        "id",
+        "home_node",
+        "current_node",
+        "in_house",
+        "progress",
+        "house",
+        "killed_other_tokens",
+        "killed_other_token_ids",
+        "killed_other_token_progress",
+    )
+
     internal_id = 1  # Class variable
 
-    def __init__(self, home_node):
+    def __init__(self, home_node, token_id=None):
         """
         Create a token object with the given start node.
 
         The current node represents the current position of the token on the
         board.
         The in_house flag indicates the token is in house before dice roll 6.
+        The progress is the index of the current node in the house path, or
+        -1 while the token is not on the path.
+        Tokens of a board get their id from the board, other tokens take the
+        next process wide id.
         """
-        self.id = Token.internal_id  # Represent unique token id.
-        Token.internal_id += 1
+        if token_id is None:
+            token_id = Token.internal_id
+            Token.internal_id += 1
+        self.id = token_id  # Represent unique token id.
         # Store Home node for future uses.
         self.home_node = home_node
         self.current_node = home_node
         self.in_house = True
+        self.progress = -1
         # House member which represents the House instance.
         self.house = home_node.house
         # Add token on the current node.
         self.current_node.add_token(self)
         # Add token in House.
         self.house.add_token(self)
-        # If it killed tokens of other house during a move
+        # If it killed tokens of other house during a move, their ids and
+        # the progress they had before they were sent back to their house.
         self.killed_other_tokens = False
-        self.killed_other_token_ids = []
+        self.killed_other_token_ids = ()
+        self.killed_other_token_progress = ()
 
     def __hash__(self):
         """Uniquely identifiable Token object."""
@@ -66,58 +87,158 @@ class Token:
 
         The token moves out of the house if the dice roll was 6 and token is in
         the house, otherwise the token moves n numbers of the nodes.
+        Tokens on their house path move by index, tokens on a graph without
+        a path table walk the linked nodes.
         """
         self.killed_other_tokens = False
-        self.killed_other_token_ids = []
+        self.killed_other_token_ids = ()
+        self.killed_other_token_progress = ()
         if self.in_house:
             if n == 6:
+                old_node = self.current_node
+                old_progress = self.progress
                 self.in_house = False
-                self.current_node.remove_token(self)
-                self.current_node = self.current_node.next_node
+                old_node.remove_token(self)
+                self.current_node = old_node.next_node
+                path = self.house.path
+                self.progress = (
+                    0 if path and path[0] is self.current_node else -1
+                )
                 self.current_node.add_token(self)
-        else:
-            if (
-                self.is_current_node_house_node()
-                and not self.current_node.has_n_next_nodes(n)
-            ):
+                self.update_board(old_node, old_progress)
+        elif self.progress >= 0:
+            progress = self.progress + n
+            path = self.house.path
+            # Tokens need an exact roll to reach the end node.
+            if progress >= len(path):
                 self.set_next_house()
                 return
-            self.current_node.remove_token(self)
-            for i in range(n):
-                if (
-                    self.current_node.node_type == NodeType.FORK
-                    and self.current_node.house == self.house
-                ):
-                    self.current_node = self.current_node.next_house_node
-                else:
-                    self.current_node = self.current_node.next_node
+            old_node = self.current_node
+            old_progress = self.progress
+            old_node.remove_token(self)
+            self.current_node = path[progress]
+            self.progress = progress
             self.kill_tokens()
             self.current_node.add_token(self)
+            self.update_board(old_node, old_progress)
+            if progress == len(path) - 1:
+                self.house.token_reached_end()
             if not self.killed_other_tokens:
                 self.set_next_house()
+        else:
+            self.walk(n)
+
+    def walk(self, n):
+        """Move the token n nodes by following the linked nodes."""
+        if (
+            self.is_current_node_house_node()
+            and not self.current_node.has_n_next_nodes(n)
+        ):
+            self.set_next_house()
+            return
+        self.current_node.remove_token(self)
+        for i in range(n):
+            if (
+                self.current_node.node_type == NodeType.FORK
+                and self.current_node.house == self.house
+            ):
+                self.current_node = self.current_node.next_house_node
+            else:
+                self.current_node = self.current_node.next_node
+        self.kill_tokens()
+        self.current_node.add_token(self)
+        if self.reached_end():
+            self.house.token_reached_end()
+        if not self.killed_other_tokens:
+            self.set_next_house()
 
     def reset(self):
         """Update current node position to the start node position."""
+        if self.reached_end():
+            self.house.token_left_end()
+        old_node = self.current_node
+        old_progress = self.progress
         self.in_house = True
-        self.current_node.remove_token(self)
+        self.progress = -1
+        old_node.remove_token(self)
         self.current_node = self.home_node
         self.current_node.add_token(self)
+        self.update_board(old_node, old_progress)
+
+    def destination(self, n):
+        """Get the node the token would land on for dice roll n, or None."""
+        if self.in_house:
+            if n == 6:
+                return self.current_node.next_node
+            return None
+        progress = self.progress + n
+        if self.progress < 0 or progress >= len(self.house.path):
+            return None
+        return self.house.path[progress]
+
+    def place(self, progress):
+        """
+        Put the token on the given path index, or in house for -1.
+
+        Used to restore board positions, so it neither kills tokens nor
+        changes the next house. Placing a token where it already is keeps it
+        there, so a finished house keeps its place in the finish order.
+        """
+        if progress == self.progress and self.in_house == (progress < 0):
+            return
+        if self.reached_end():
+            self.house.token_left_end()
+        old_node = self.current_node
+        old_progress = self.progress
+        old_node.remove_token(self)
+        if progress < 0:
+            self.in_house = True
+            self.current_node = self.home_node
+        else:
+            self.in_house = False
+            self.current_node = self.house.path[progress]
+        self.progress = progress
+        self.current_node.add_token(self)
+        self.update_board(old_node, old_progress)
+        if self.reached_end():
+            self.house.token_reached_end()
+
+    def update_board(self, old_node, old_progress):
+        """Tell the board the token moved from the old node and progress."""
+        board = self.house.board
+        if board is not None:
+            board.token_moved(self, old_progress, old_node.square)
 
     def kill_tokens(self):
-        """Kill the tokens of other houses."""
-        if not self.current_node.is_safe:
-            other_tokens = []
-            for token in self.current_node.tokens:
-                if self.house != token.house:
-                    other_tokens.append(token)
-
-            for token in other_tokens:
-                token.reset()
-
-            self.killed_other_token_ids.extend(
-                [token.id for token in other_tokens]
+        """
+        Kill the tokens of other houses.
+
+        On a board the victims come from the occupancy of the board, off a
+        board from the tokens of the current node.
+        """
+        board = self.house.board
+        if board is not None:
+            other_tokens = board.captured_tokens(
+                self.house, self.current_node.square
             )
-            self.killed_other_tokens = len(other_tokens) > 0
+        elif not self.current_node.is_safe and self.current_node.tokens:
+            other_tokens = [
+                token
+                for token in self.current_node.tokens
+                if self.house != token.house
+            ]
+        else:
+            return
+        if not other_tokens:
+            return
+
+        self.killed_other_token_ids = [token.id for token in other_tokens]
+        self.killed_other_token_progress = [
+            token.progress for token in other_tokens
+        ]
+        for token in other_tokens:
+            token.reset()
+        self.killed_other_tokens = True
 
     def reached_end(self):
         """Token reached end node."""
@@ -127,11 +248,25 @@ class Token:
         )
 
     def set_next_house(self):
-        """Set Next house."""
+        """
+        Set Next house.
+
+        Houses on a board take the next unfinished house in the board's turn
+        order. Other houses follow the next house pointers, at most once
+        around, so finished houses can never make this loop forever.
+        """
+        board = self.house.board
+        if board is not None:
+            next_house = board.next_unfinished_house(self.house)
+            if next_house is not None:
+                self.house.next_house = next_house
+            return
+        seen = {self.house}
         next_house = self.house.next_house
-        while next_house.all_tokens_reached_end():
+        while next_house not in seen and next_house.all_tokens_reached_end():
+            seen.add(next_house)
             next_house = next_house.next_house
-        if next_house != self.house:
+        if next_house not in seen:
             self.house.next_house = next_house
 
     def is_current_node_house_node(self):
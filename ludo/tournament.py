@@ -0,0 +1,139 @@
+"""Tournament Package."""
+
+import argparse
+import hashlib
+import multiprocessing
+import random
+import time
+
+from ludo.engine import Engine
+from ludo.house import HouseType
+
+NUM_HOUSES = 4
+
+
+def stream_seed(seed, stream):
+    """Derive the independent seed of a random stream from a master seed."""
+    digest = hashlib.sha256(f"ludo-{seed}-{stream}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class TournamentResult:
+    """Aggregated results of many games."""
+
+    __slots__ = ("games", "turns", "placings")
+
+    def __init__(self):
+        """Create an empty result."""
+        self.games = 0
+        self.turns = 0
+        # placings[house][place] counts the house finishing in that place,
+        # the house left on the board takes the last place.
+        self.placings = [[0] * NUM_HOUSES for i in range(NUM_HOUSES)]
+
+    @property
+    def wins(self):
+        """Get the number of wins of each house in turn order."""
+        return [placings[0] for placings in self.placings]
+
+    def win_rates(self):
+        """Get the win rate of each house in turn order."""
+        return [wins / self.games if self.games else 0.0 for wins in self.wins]
+
+    def add_game(self, board, turns):
+        """Add the result of a completed game on the board."""
+        self.games += 1
+        self.turns += turns
+        finished = [board.house_index(house) for house in board.finish_order]
+        for house_index in range(NUM_HOUSES):
+            if house_index not in finished:
+                finished.append(house_index)
+        for place, house_index in enumerate(finished):
+            self.placings[house_index][place] += 1
+
+    def merge(self, other):
+        """Add the results of another tournament result."""
+        self.games += other.games
+        self.turns += other.turns
+        for placings, other_placings in zip(self.placings, other.placings):
+            for place, count in enumerate(other_placings):
+                placings[place] += count
+        return self
+
+
+def play_games(seed, stream, num_games):
+    """Play games on their own random stream and aggregate the results."""
+    rng = random.Random(stream_seed(seed, stream))
+    result = TournamentResult()
+    for i in range(num_games):
+        engine = Engine(rng=rng)
+        board = engine.board
+        turns = 0
+        while not board.completed():
+            engine.play_turn()
+            turns += 1
+        result.add_game(board, turns)
+    return result
+
+
+def _play_games(args):
+    """Unpack the arguments of play_games for a process pool."""
+    return play_games(*args)
+
+
+def run_tournament(num_games, seed=0, processes=None, chunk_size=500):
+    """
+    Play games split into chunks across a process pool.
+
+    Every chunk plays on its own random stream derived from the master
+    seed, so results only depend on the seed, not on the number of
+    processes.
+    """
+    chunks = []
+    for stream, start in enumerate(range(0, num_games, chunk_size)):
+        chunks.append((seed, stream, min(chunk_size, num_games - start)))
+    result = TournamentResult()
+    if processes == 1:
+        for chunk in chunks:
+            result.merge(_play_games(chunk))
+        return result
+    with multiprocessing.Pool(processes) as pool:
+        for chunk_result in pool.imap_unordered(_play_games, chunks):
+            result.merge(chunk_result)
+    return result
+
+
+def main(argv=None):
+    """Run a tournament and report win rates and games per second."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ludo.tournament", description=main.__doc__
+    )
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = run_tournament(
+        args.games, args.seed, args.processes, args.chunk_size
+    )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{result.games} games in {elapsed:.2f}s, "
+        f"{result.games / elapsed:.0f} games per second"
+    )
+    print(f"{result.turns / result.games:.1f} turns per game")
+    house_types = [
+        HouseType.BLUE,
+        HouseType.RED,
+        HouseType.GREEN,
+        HouseType.YELLOW,
+    ]
+    for house_type, win_rate in zip(house_types, result.win_rates()):
+        print(f"{house_type.value}: {win_rate:.2%} wins")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Vector Package."""
+
+import functools
+
+import numpy as np
+
+from ludo.board import Board, BoardState
+
+NUM_HOUSES = 4
+NUM_TOKENS = 4
+# Number of squares on the shared track.
+NUM_SQUARES = 52
+# Progress of a token in house and of a token at the end node.
+HOME = -1
+END = 56
+
+
+@functools.lru_cache(maxsize=None)
+def tables():
+    """
+    Build the lookup tables of the vector backend from a board.
+
+    squares[house, progress + 1] is the shared track square of a house's
+    token at that progress, or -1 in house and on the house nodes, and
+    safe[square] tells the square is a start or star node.
+    """
+    board = Board()
+    track = []
+    node = board.blue_house.get_fork_node()
+    while len(track) < NUM_SQUARES:
+        track.append(node)
+        node = node.next_node
+    square_of_node = {node: square for square, node in enumerate(track)}
+    squares = np.full((NUM_HOUSES, END + 2), -1, dtype=np.int16)
+    for house_index, house in enumerate(board.houses):
+        for progress, node in enumerate(house.path):
+            squares[house_index, progress + 1] = square_of_node.get(node, -1)
+    safe = np.array([node.is_safe for node in track], dtype=bool)
+    squares.setflags(write=False)
+    safe.setflags(write=False)
+    return squares, safe
+
+
+class VectorGames:
+    """
+    Play many games in lockstep with NumPy arrays.
+
+    Every game keeps its token progress in progress[game, house, token],
+    with -1 in house, and one turn of every unfinished game is played per
+    step. Tokens choose uniformly among the distinct legal moves, like the
+    object engine.
+    """
+
+    def __init__(self, num_games, seed=None):
+        """Create the arrays of num_games new games."""
+        self.rng = np.random.default_rng(seed)
+        self.squares, self.safe = tables()
+        self.progress = np.full(
+            (num_games, NUM_HOUSES, NUM_TOKENS), HOME, dtype=np.int8
+        )
+        self.current_house = np.zeros(num_games, dtype=np.int8)
+        # Whether the current house rolls again.
+        self.extra_turn = np.zeros(num_games, dtype=bool)
+        # places[game, house] is the finishing place of the house, or -1.
+        self.places = np.full((num_games, NUM_HOUSES), -1, dtype=np.int8)
+        self.done = np.zeros(num_games, dtype=bool)
+        self.turns = np.zeros(num_games, dtype=np.int64)
+
+    @property
+    def in_house(self):
+        """Get the mask of tokens in house."""
+        return self.progress == HOME
+
+    @property
+    def finished(self):
+        """Get the mask of houses whose tokens all reached end."""
+        return self.places >= 0
+
+    @property
+    def winners(self):
+        """Get the winner house index of each game, or -1."""
+        winners = np.argmin(np.where(self.finished, self.places, 127), 1)
+        return np.where(self.finished.any(1), winners, -1)
+
+    def load(self, game, state):
+        """Load a board state taken by Board.snapshot into a game."""
+        self.progress[game] = np.reshape(
+            state.progress, (NUM_HOUSES, NUM_TOKENS)
+        )
+        self.current_house[game] = state.current_house
+        self.extra_turn[game] = state.extra_turn
+        self.places[game] = -1
+        for place, house_index in enumerate(state.finish_order):
+            self.places[game, house_index] = place
+        self.done[game] = len(state.finish_order) >= NUM_HOUSES - 1
+
+    def state(self, game):
+        """Get the board state of a game, next houses follow turn order."""
+        progress = tuple(int(p) for p in self.progress[game].ravel())
+        places = self.places[game]
+        finish_order = tuple(
+            int(house_index)
+            for house_index in np.argsort(places)
+            if places[house_index] >= 0
+        )
+        return BoardState(
+            progress,
+            tuple(p == HOME for p in progress),
+            int(self.current_house[game]),
+            tuple((index + 1) % NUM_HOUSES for index in range(NUM_HOUSES)),
+            finish_order,
+            bool(self.extra_turn[game]),
+        )
+
+    def step(self, rolls=None):
+        """
+        Play one turn of every unfinished game.
+
+        Returns the rolls of the turn, rolled for every game unless given.
+        """
+        num_games = len(self.done)
+        if rolls is None:
+            rolls = self.rng.integers(1, 7, num_games, dtype=np.int8)
+        # Only games still being played take a turn.
+        games = np.flatnonzero(~self.done)
+        game_rolls = rolls[games]
+        house = self.current_house[games].astype(np.intp)
+        progress = self.progress[games, house]
+
+        # Legal moves, tokens on the same progress share a move.
+        target = progress + game_rolls[:, None]
+        legal = np.where(
+            progress == HOME, game_rolls[:, None] == 6, target <= END
+        )
+        legal &= progress != END
+        for token in range(1, NUM_TOKENS):
+            for other in range(token):
+                legal[:, token] &= progress[:, token] != progress[:, other]
+
+        # Choose uniformly among the legal moves.
+        keys = np.where(legal, self.rng.random(legal.shape), -1.0)
+        choice = np.argmax(keys, 1)
+        moved = legal[np.arange(len(games)), choice]
+        moved_games = games[moved]
+        moved_houses = house[moved]
+        moved_tokens = choice[moved]
+        old = progress[moved, moved_tokens]
+        new = np.where(old == HOME, 0, old + game_rolls[moved])
+        self.progress[moved_games, moved_houses, moved_tokens] = new
+
+        # Capture tokens of other houses on an unsafe track square.
+        captured = np.zeros(num_games, dtype=bool)
+        square = self.squares[moved_houses, new + 1]
+        hits = (square >= 0) & ~self.safe[square]
+        if hits.any():
+            hit_games = moved_games[hits]
+            hit_progress = self.progress[hit_games]
+            all_squares = self.squares[
+                np.arange(NUM_HOUSES)[None, :, None],
+                hit_progress.astype(np.intp) + 1,
+            ]
+            victims = all_squares == square[hits][:, None, None]
+            victims[np.arange(len(hit_games)), moved_houses[hits]] = False
+            self.progress[hit_games] = np.where(victims, HOME, hit_progress)
+            captured[hit_games] = victims.any((1, 2))
+
+        # Rank houses whose last token just reached end.
+        reached_end = new == END
+        if reached_end.any():
+            end_games = moved_games[reached_end]
+            end_houses = moved_houses[reached_end]
+            all_end = (self.progress[end_games, end_houses] == END).all(1)
+            end_games = end_games[all_end]
+            self.places[end_games, end_houses[all_end]] = self.finished[
+                end_games
+            ].sum(1)
+
+        # A 6 or a capture gives another turn, else pass to the next house
+        # with tokens left.
+        finished = self.finished[games]
+        rows = np.arange(len(games))
+        keep = (game_rolls == 6) | captured[games]
+        keep &= ~finished[rows, house]
+        candidates = (house[:, None] + np.arange(1, NUM_HOUSES)) % NUM_HOUSES
+        open_candidates = ~finished[rows[:, None], candidates]
+        next_house = candidates[rows, np.argmax(open_candidates, 1)]
+        self.current_house[games] = np.where(keep, house, next_house)
+        self.extra_turn[games] = keep
+        self.turns[games] += 1
+        self.done[games] = finished.sum(1) >= NUM_HOUSES - 1
+        return rolls
+
+    def run(self, max_turns=100000):
+        """Play turns until every game is completed, get the winners."""
+        for i in range(max_turns):
+            if self.done.all():
+                break
+            self.step()
+        return self.winners
@@ -16,8 +16,7 @@ from kivy.utils import get_color_from_hex
 from kivy.metrics import dp, sp  # Added for scaling
 
 from ludo.board import Board
-
-from random import randint
+from ludo.engine import Engine
 
 if TYPE_CHECKING:
     from typing_extensions import Final
@@ -613,7 +612,8 @@ class Game:
     NUM_TOKENS: Final = 4
     END_GRID_CELLS: Final = 9
     BOARD = Board()
-    CURRENT_HOUSE = BOARD.red_house
+    BOARD.current_house = BOARD.red_house
+    ENGINE = Engine(BOARD)
     DICE_ROLL = 0
     PREV_TOKEN_LOC_CELL = None
     PREV_TOKEN_LOC_CELL_VARIANT = None
@@ -644,45 +644,18 @@ class Game:
             game_cell_msg += f"[BEFORE]: with token ids {game_cell.token_ids}\n"
             board = Game.BOARD
             token_ids = list(game_cell.token_ids.keys())
-            token_choice = randint(0, len(game_cell.token_ids) - 1)
+            token_choice = Game.ENGINE.rng.randrange(len(game_cell.token_ids))
             game_cell_msg += (
                 f"[BEFORE]: select token choice {token_choice}  \n"
             )
             token_id = token_ids[token_choice]
             game_cell_msg += f"[BEFORE]: selected token id {token_id}  \n"
-            token_label = game_cell.token_ids[token_id]
             token = board.get_token(token_id)
-            token.move(Game.DICE_ROLL)
-
-            del game_cell.token_ids[token_id]
-
+            board.make_move(token_id, Game.DICE_ROLL)
             next_cell_id = token.current_node.id
             next_game_cell = self.get_game_cell_safely(next_cell_id)
-            next_game_cell.token_ids[token_id] = token_label
-
             token_loc_cell = self.get_token_location_cell_safely(token_id)
-            if token.reached_end():
-                token_loc_cell.set_variant("success")
-                token_loc_cell.text = "REACHED END"
-                Game.PREV_TOKEN_LOC_CELL = None
-            else:
-                for killed_token_id in token.killed_other_token_ids:
-                    killed_token = board.get_token(killed_token_id)
-                    killed_token_cell = self.get_token_location_cell_safely(killed_token_id)
-                    killed_token_cell_id = killed_token.current_node.id
-                    killed_token_home_cell = self.get_game_cell_safely(killed_token_cell_id)
-                    killed_token_home_cell.token_ids[
-                        killed_token_id
-                    ] = next_game_cell.token_ids[killed_token_id]
-                    killed_token_cell.set_variant("error")
-                    killed_token_cell.text = f"At: {killed_token_cell_id}"
-
-                    del next_game_cell.token_ids[killed_token_id]
-                    Game.PREV_TOKEN_LOC_CELL = None
-                token_loc_cell.set_variant("warning")
-                token_loc_cell.text = f"At: {next_cell_id}"
-                Game.PREV_TOKEN_LOC_CELL = token_loc_cell
-                Game.PREV_TOKEN_LOC_CELL_VARIANT = "primary"
+            self.show_move(token, game_cell)
 
             game_cell_msg += f"[AFTER] with token ids {game_cell.token_ids}\n"
             game_cell_msg += f"Next node is {next_cell_id} \n"
@@ -695,6 +668,46 @@ class Game:
         else:
             game_cell_msg += "with no tokens"
 
+    def show_move(self, token, game_cell: GameCell):
+        """Move the token label from the game cell to the token's new cell.
+
+        Labels of tokens killed by the move go back to their home cells.
+
+        Returns:
+            list: The labels of the killed tokens.
+        """
+        board = Game.BOARD
+        token_id = token.id
+        token_label = game_cell.token_ids.pop(token_id)
+
+        next_cell_id = token.current_node.id
+        next_game_cell = self.get_game_cell_safely(next_cell_id)
+        next_game_cell.token_ids[token_id] = token_label
+
+        killed_token_labels = []
+        token_loc_cell = self.get_token_location_cell_safely(token_id)
+        if token.reached_end():
+            token_loc_cell.set_variant("success")
+            token_loc_cell.text = "REACHED END"
+            Game.PREV_TOKEN_LOC_CELL = None
+        else:
+            for killed_token_id in token.killed_other_token_ids:
+                killed_token = board.get_token(killed_token_id)
+                killed_token_cell = self.get_token_location_cell_safely(killed_token_id)
+                killed_token_cell_id = killed_token.current_node.id
+                killed_token_home_cell = self.get_game_cell_safely(killed_token_cell_id)
+                killed_token_label = next_game_cell.token_ids.pop(killed_token_id)
+                killed_token_home_cell.token_ids[killed_token_id] = killed_token_label
+                killed_token_labels.append(killed_token_label)
+                killed_token_cell.set_variant("error")
+                killed_token_cell.text = f"At: {killed_token_cell_id}"
+                Game.PREV_TOKEN_LOC_CELL = None
+            token_loc_cell.set_variant("warning")
+            token_loc_cell.text = f"At: {next_cell_id}"
+            Game.PREV_TOKEN_LOC_CELL = token_loc_cell
+            Game.PREV_TOKEN_LOC_CELL_VARIANT = "primary"
+        return killed_token_labels
+
     def on_button_pressed(self, instance) -> None:
         """React to a press of a button on the game grid.
 
@@ -718,7 +731,7 @@ class Game:
         def game_loop():
             """Game loop running in a background thread."""
             Clock.schedule_once(
-                lambda dt: self.update_message(message="AUTO PLAYING NOW."))
+                lambda dt: self.update_message(message=f"AUTO PLAYING NOW. SEED: {Game.ENGINE.seed}"))
 
             while not board.completed():
                 self.play_next_move()
@@ -776,8 +789,8 @@ class Game:
 
     def play_next_move(self):
         """Play next move, update token positions, game cell, and labels."""
-        current_house = Game.CURRENT_HOUSE  # Get the current house
         board = Game.BOARD  # Get the game board instance
+        current_house = board.current_house  # Get the current house
 
         # Determine current house color
         house_color = "Blue" if current_house.type == board.blue_house.type else \
@@ -788,64 +801,32 @@ class Game:
         Clock.schedule_once(
             lambda dt: self.update_message(current_house=f"Current house: {house_color}"))
 
-        # Roll the dice
-        Game.DICE_ROLL = randint(1, 6)
+        # Previous node of every token of the house, to find their cells
+        previous_node_ids = {
+            token.id: token.current_node.id for token in current_house.tokens
+        }
+
+        # Roll the dice and play the turn with the headless engine
+        turn = Game.ENGINE.play_turn()
+        Game.DICE_ROLL = turn.roll
         Clock.schedule_once(
             lambda dt: self.update_message(dice_roll=f"    Dice Roll: {Game.DICE_ROLL}"))
 
-        tokens_in_house = current_house.get_tokens_in_house()
-        num_tokens_in_house = len(tokens_in_house)
-        killed_other_tokens = False
-        play_new_token = False
-
-        # Logic for moving a new token if dice roll is 6
-        if Game.DICE_ROLL == 6:
-            if num_tokens_in_house == 4:
-                play_new_token = True
-            elif num_tokens_in_house > 0:
-                play_new_token = randint(0, 5) % 2 == 0
-
-        if play_new_token:
-            token_choice = randint(0, num_tokens_in_house - 1)
-            token_home_node_ids = current_house.get_all_token_home_node_ids()
-            if len(token_home_node_ids) > 0:
-                home_node_id = token_home_node_ids[token_choice]
-                game_cell = self.get_game_cell_safely(home_node_id)
-                self.game_cell_button_pressed(game_cell)
-                Clock.schedule_once(lambda dt: self.update_message(message=" "))
-        else:
-            tokens_in_play = current_house.get_token_ids_in_play()
-            num_tokens_in_play = len(tokens_in_play)
-
-            if num_tokens_in_play > 0:
-                token_choice = randint(0, num_tokens_in_play - 1)
-                token_id = tokens_in_play[token_choice]
-                token = board.get_token(token_id)
-                game_cell = self.get_game_cell_safely(token.current_node.id)
-                self.game_cell_button_pressed(game_cell)
-
-                killed_other_tokens = token.killed_other_tokens
-
-                if killed_other_tokens:
-                    killed_token_names = []
-                    for killed_token_id in token.killed_other_token_ids:
-                        killed_token = board.get_token(killed_token_id)
-                        killed_token_cell_id = killed_token.current_node.id
-                        killed_token_home_cell = self.get_game_cell_safely(killed_token_cell_id)
-                        killed_token_names.append(killed_token_home_cell.token_ids[killed_token_id])
-
-                    killed_tokens_msg = f"Killed: {', '.join(killed_token_names)}"
-                    Clock.schedule_once(
-                        lambda dt: self.update_message(message=killed_tokens_msg))
-                else:
-                    Clock.schedule_once(lambda dt: self.update_message(message=" "))
-            else:
-                Clock.schedule_once(
-                    lambda dt: self.update_message(message="NO TOKEN YET IN PLAY!!!"))
+        if turn.move is None:
+            Clock.schedule_once(
+                lambda dt: self.update_message(message="NO TOKEN YET IN PLAY!!!"))
+            return
+
+        token = turn.move.token
+        game_cell = self.get_game_cell_safely(previous_node_ids[token.id])
+        killed_token_labels = self.show_move(token, game_cell)
 
-        # If dice roll is not 6 and no tokens were killed, move to the next house
-        if not Game.DICE_ROLL == 6 and not killed_other_tokens:
-            Game.CURRENT_HOUSE = Game.CURRENT_HOUSE.next_house
+        if killed_token_labels:
+            killed_tokens_msg = f"Killed: {', '.join(killed_token_labels)}"
+            Clock.schedule_once(
+                lambda dt: self.update_message(message=killed_tokens_msg))
+        else:
+            Clock.schedule_once(lambda dt: self.update_message(message=" "))
 
     def update_message(self, message=None, winner=None, current_house=None, dice_roll=None):
         """Safely update the message label on the main thread."""
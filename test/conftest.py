@@ -0,0 +1,19 @@
+"""Shared fixtures of the tests."""
+
+import os
+
+import pytest
+
+from ludo.storage import CACHE_DIR_VARIABLE
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory):
+    """Keep generated data files of the tests in a temporary directory."""
+    previous = os.environ.get(CACHE_DIR_VARIABLE)
+    os.environ[CACHE_DIR_VARIABLE] = str(tmp_path_factory.mktemp("cache"))
+    yield os.environ[CACHE_DIR_VARIABLE]
+    if previous is None:
+        del os.environ[CACHE_DIR_VARIABLE]
+    else:
+        os.environ[CACHE_DIR_VARIABLE] = previous
@@ -1,7 +1,10 @@
 """Tests for Board module."""
 
+import random
+
 from ludo.board import Board
 from ludo.node import NodeType
+import pytest
 
 
 def test_board_is_valid():
@@ -35,3 +38,366 @@ def check_house(house):
     for node in house.nodes:
         if node.node_type != NodeType.END:
             assert node.next_node
+
+
+def test_get_node_and_token_by_id():
+    """Nodes and tokens are found by their ids."""
+    board = Board()
+
+    for node in board.nodes:
+        assert board.get_node(node.id) is node
+    for token in board.tokens:
+        assert board.get_token(token.id) is token
+
+
+def test_get_tokens_by_ids():
+    """Bulk lookup returns the tokens in the order of the given ids."""
+    board = Board()
+    token_ids = [token.id for token in board.red_house.tokens]
+
+    tokens = board.get_tokens(reversed(token_ids))
+
+    assert [token.id for token in tokens] == token_ids[::-1]
+    assert len(board.get_nodes([node.id for node in board.nodes])) == 76
+
+
+def test_get_missing_id_raises_key_error():
+    """Looking up an unknown id raises a KeyError."""
+    board = Board()
+
+    with pytest.raises(KeyError):
+        board.get_node(-1)
+    with pytest.raises(KeyError):
+        board.get_token(-1)
+    with pytest.raises(KeyError):
+        board.get_tokens([board.tokens[0].id, -1])
+
+
+def move_to_end(token):
+    """Move a token out of house and along its whole path to end node."""
+    for roll in [6, 6, 6, 6, 6, 6, 6, 6, 6, 2, 6]:
+        token.move(roll)
+    assert token.reached_end()
+
+
+def test_finish_order_and_completion():
+    """Houses are ranked in the order all their tokens reached end."""
+    board = Board()
+
+    for house in [board.red_house, board.blue_house, board.yellow_house]:
+        assert not board.completed()
+        for token in house.tokens:
+            move_to_end(token)
+        assert house.all_tokens_reached_end()
+
+    assert board.completed()
+    assert board.winner_house == board.red_house
+    assert board.finish_order == (
+        board.red_house,
+        board.blue_house,
+        board.yellow_house,
+    )
+    assert not board.green_house.all_tokens_reached_end()
+
+
+def test_token_leaving_end_unfinishes_house():
+    """A house is no longer finished once one of its tokens left end."""
+    board = Board()
+    tokens = list(board.green_house.tokens)
+    for token in tokens:
+        move_to_end(token)
+    assert board.winner_house == board.green_house
+
+    tokens[0].reset()
+
+    assert board.winner_house is None
+    assert board.finish_order == ()
+    assert board.green_house.num_tokens_reached_end == 3
+
+
+def test_every_board_uses_the_same_ids():
+    """Ids are allocated per board, not per process."""
+    board_1 = Board()
+    board_2 = Board()
+
+    assert [node.id for node in board_1.nodes] == [
+        node.id for node in board_2.nodes
+    ]
+    assert sorted(token.id for token in board_2.tokens) == list(range(1, 17))
+    assert [
+        board_2.blue_house.id,
+        board_2.red_house.id,
+        board_2.green_house.id,
+        board_2.yellow_house.id,
+    ] == [1, 2, 3, 4]
+    home_node_ids = [
+        node.id for house in board_2.houses for node in house.home_nodes
+    ]
+    node_ids = home_node_ids + [node.id for node in board_2.nodes]
+    assert sorted(node_ids) == list(range(92))
+
+
+def play_random_moves(board, num_moves, seed):
+    """Move random tokens of the board by random dice rolls."""
+    rng = random.Random(seed)
+    for i in range(num_moves):
+        rng.choice(board.tokens).move(rng.randint(1, 6))
+
+
+def test_snapshot_restore_round_trip():
+    """Restoring a snapshot brings back the exact board position."""
+    board = Board()
+    play_random_moves(board, 300, seed=7)
+    board.current_house = board.green_house
+    state = board.snapshot()
+    node_ids = [token.current_node.id for token in board.tokens]
+
+    play_random_moves(board, 300, seed=8)
+    board.current_house = board.red_house
+    assert board.snapshot() != state
+
+    board.restore(state)
+
+    assert board.snapshot() == state
+    assert [token.current_node.id for token in board.tokens] == node_ids
+    assert board.current_house == board.green_house
+    for node in board.nodes:
+        for token in node.tokens:
+            assert token.current_node is node
+
+
+def test_restore_finished_houses():
+    """Restoring a snapshot restores finished houses and their order."""
+    board = Board()
+    for house in [board.yellow_house, board.blue_house]:
+        for token in house.tokens:
+            move_to_end(token)
+    state = board.snapshot()
+    assert state.winner == board.house_index(board.yellow_house)
+
+    board.restore(Board().snapshot())
+    assert board.winner_house is None
+    assert board.yellow_house.num_tokens_reached_end == 0
+
+    board.restore(state)
+    assert board.finish_order == (board.yellow_house, board.blue_house)
+    assert board.blue_house.all_tokens_reached_end()
+
+
+def test_house_index_follows_turn_order():
+    """Houses are indexed by their position in the turn order."""
+    board = Board()
+
+    for index, house in enumerate(board.houses):
+        assert board.house_index(house) == index
+    assert board.houses[board.snapshot().current_house] == board.blue_house
+
+
+def test_make_and_unmake_moves():
+    """Unmaking moves in reverse order restores every earlier position."""
+    board = Board()
+    rng = random.Random(11)
+    states = []
+    records = []
+    while not board.completed():
+        token = rng.choice(board.tokens)
+        states.append(board.snapshot())
+        records.append(board.make_move(token.id, rng.randint(1, 6)))
+
+    assert any(record.captured for record in records)
+    assert board.winner_house is not None
+
+    while records:
+        board.unmake_move(records.pop())
+        assert board.snapshot() == states.pop()
+    for node in board.nodes:
+        assert len(node.tokens) == 0
+
+
+def test_make_move_records_captured_tokens():
+    """The undo record lists captured tokens with their progress."""
+    board = Board()
+    blue_token = board.get_token(1)
+    red_token = board.get_token(5)
+    board.make_move(red_token.id, 6)
+    board.make_move(red_token.id, 4)
+    board.make_move(blue_token.id, 6)
+    for roll in [6, 6, 1]:
+        board.make_move(blue_token.id, roll)
+    red_progress = red_token.progress
+    red_node = red_token.current_node
+
+    record = board.make_move(blue_token.id, 4)
+
+    assert record.captured == ((red_token, red_progress),)
+    assert red_token.in_house
+    board.unmake_move(record)
+    assert red_token.current_node is red_node
+    assert blue_token.progress == 13
+
+
+def test_legal_moves_need_six_to_leave_house():
+    """Tokens in house only move out on a 6 and count as a single move."""
+    board = Board()
+
+    assert board.legal_moves(board.blue_house, 5) == []
+    moves = board.legal_moves(board.blue_house, 6)
+    assert len(moves) == 1
+    assert moves[0].destination == board.blue_house.get_start_node()
+    assert moves[0].captures == ()
+
+
+def test_legal_moves_skip_stacked_tokens_and_overshoots():
+    """Stacked tokens give one move and overshooting end is not legal."""
+    board = Board()
+    token_1, token_2, token_3, token_4 = board.house_tokens[board.red_house]
+    token_1.place(3)
+    token_2.place(3)
+    token_3.place(54)
+
+    moves = board.legal_moves(board.red_house, 4)
+
+    assert [move.token.progress for move in moves] == [3]
+    assert moves[0].destination == board.red_house.path[7]
+    moves = board.legal_moves(board.red_house, 2)
+    assert sorted(move.token.progress for move in moves) == [3, 54]
+    assert board.legal_moves(board.red_house, 6)[-1].token == token_4
+
+
+def test_legal_moves_list_captures():
+    """Tokens of other houses on an unsafe destination are captured."""
+    board = Board()
+    blue_token = board.get_token(1)
+    red_token = board.get_token(5)
+    blue_token.place(17)
+    red_token.place(0)
+
+    moves = board.legal_moves(board.red_house, 4)
+
+    assert moves[0].destination == blue_token.current_node
+    assert moves[0].captures == (blue_token,)
+    record = board.make_move(moves[0].token.id, 4)
+    assert record.captured == ((blue_token, 17),)
+
+
+def check_occupancy(board):
+    """Check the occupancy matches the tokens on the track."""
+    for index, house in enumerate(board.houses):
+        mask = 0
+        for token in house.tokens:
+            square = token.current_node.square
+            if square >= 0:
+                mask |= 1 << square
+                assert token in board.square_tokens[index][square]
+        assert board.occupancy[index] == mask
+        assert sum(map(len, board.square_tokens[index])) == sum(
+            token.current_node.square >= 0 for token in house.tokens
+        )
+
+
+def test_track_squares_and_safe_mask():
+    """The 52 shared track squares are numbered once each."""
+    board = Board()
+    squares = sorted(
+        node.square for node in board.nodes if node.square >= 0
+    )
+
+    assert squares == list(range(52))
+    assert bin(board.safe_mask).count("1") == 8
+    for house in board.houses:
+        assert house.path[50].square >= 0
+        assert house.path[51].square == -1
+
+
+def test_occupancy_follows_moves_and_undo():
+    """Occupancy stays in sync with tokens through moves and undo."""
+    board = Board()
+    rng = random.Random(5)
+    records = []
+    while not board.completed():
+        token = rng.choice(board.tokens)
+        records.append(board.make_move(token.id, rng.randint(1, 6)))
+        check_occupancy(board)
+    while records:
+        board.unmake_move(records.pop())
+        check_occupancy(board)
+    assert board.occupancy == [0, 0, 0, 0]
+
+
+def test_threat_mask_matches_legal_moves():
+    """Threatened squares are the unsafe ones other houses can reach."""
+    board = Board()
+    rng = random.Random(8)
+    for turn in range(300):
+        token = rng.choice(board.tokens)
+        board.make_move(token.id, rng.randint(1, 6))
+        house = rng.choice(board.houses)
+        reachable = set()
+        for other in board.houses:
+            if other == house:
+                continue
+            for roll in range(1, 7):
+                for move in board.legal_moves(other, roll):
+                    if move.token.in_house:
+                        continue
+                    square = move.destination.square
+                    if square >= 0 and not move.destination.is_safe:
+                        reachable.add(square)
+        expected = sum(1 << square for square in reachable)
+        assert board.threat_mask(house) == expected
+
+
+def test_position_key_is_updated_incrementally():
+    """The position key matches a full recompute after every change."""
+    board = Board()
+    rng = random.Random(3)
+    records = []
+    keys = []
+    while not board.completed():
+        token = rng.choice(board.tokens)
+        keys.append(board.position_key)
+        records.append(board.make_move(token.id, rng.randint(1, 6)))
+        assert board.position_key == board.compute_position_key()
+    while records:
+        board.unmake_move(records.pop())
+        assert board.position_key == keys.pop()
+
+
+def test_position_key_depends_on_position_only():
+    """Equal positions reached by different moves have the same key."""
+    board = Board()
+    other = Board()
+    board.get_token(1).place(4)
+    board.get_token(2).place(9)
+    other.get_token(2).place(9)
+    other.get_token(1).place(4)
+
+    assert board.position_key == other.position_key
+    other.current_house = other.red_house
+    assert board.position_key != other.position_key
+    other.current_house = other.blue_house
+    other.extra_turn = True
+    assert board.position_key != other.position_key
+    other.restore(board.snapshot())
+    assert board.position_key == other.position_key
+
+
+def test_captured_tokens_come_from_the_occupancy():
+    """Victims from the occupancy are the other houses' tokens on the node."""
+    board = Board()
+    rng = random.Random(9)
+    for turn in range(400):
+        token = rng.choice(board.tokens)
+        board.make_move(token.id, rng.randint(1, 6))
+        for house in board.houses:
+            for node in board.nodes:
+                if node.square < 0:
+                    continue
+                expected = set()
+                if not node.is_safe:
+                    expected = {
+                        other for other in node.tokens if other.house != house
+                    }
+                assert set(board.captured_tokens(house, node.square)) == (
+                    expected
+                )
@@ -0,0 +1,90 @@
+"""Tests for Cache module."""
+
+import pytest
+
+from ludo.board import Board
+from ludo.cache import EvalCache, get_shared_cache
+from ludo.expectimax import ExpectimaxPlayer
+
+
+def test_cache_counts_hits_misses_and_evictions():
+    """Lookups and evictions are counted."""
+    cache = EvalCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_cache_persists_between_launches(tmp_path):
+    """A saved cache is loaded warm, in the same recency order."""
+    path = str(tmp_path / "evaluations.bin")
+    cache = EvalCache(max_size=3, path=path)
+    for key in range(3):
+        cache.put(("expectimax", 2**64 - 1 - key, 2), (key / 3, 0.5))
+    cache.get(("expectimax", 2**64 - 1, 2))
+    cache.save()
+
+    warm = EvalCache(max_size=3, path=path)
+    warm.put(("other", 3, 1), (1.0,))
+
+    assert len(warm) == 3
+    assert ("expectimax", 2**64 - 2, 2) not in warm
+    assert warm.get(("expectimax", 2**64 - 1, 2)) == (0.0, 0.5)
+    assert warm.get(("expectimax", 2**64 - 3, 2)) == (2 / 3, 0.5)
+
+
+def test_cache_rejects_other_files(tmp_path):
+    """Files without the cache header are not loaded."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a cache")
+
+    with pytest.raises(Exception):
+        EvalCache(path=str(path))
+
+
+def test_save_needs_a_path():
+    """A cache without a file can not be saved."""
+    with pytest.raises(Exception):
+        EvalCache().save()
+
+
+def test_players_share_evaluations():
+    """A second player searching the same position hits the shared cache."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 4)
+    cache = EvalCache()
+    ExpectimaxPlayer(cache=cache).move_values(
+        board, board.blue_house, 4, moves
+    )
+    misses = cache.misses
+
+    ExpectimaxPlayer(cache=cache).move_values(
+        board, board.blue_house, 4, moves
+    )
+
+    assert cache.misses == misses
+    assert cache.hits > 0
+
+
+def test_shared_cache_lives_in_the_cache_directory(cache_dir):
+    """The shared cache saves to the cache directory."""
+    cache = get_shared_cache()
+
+    assert cache is get_shared_cache()
+    assert cache.path.startswith(cache_dir)
+
+
+def test_players_use_the_shared_cache_by_default():
+    """Players without a cache or size share the evaluations of all."""
+    assert ExpectimaxPlayer().cache is get_shared_cache()
+    assert ExpectimaxPlayer(cache_size=10).cache is not get_shared_cache()
@@ -0,0 +1,55 @@
+"""Tests for Dice module."""
+
+import random
+
+import pytest
+
+from ludo.dice import BufferedDice, RandomDice, ScriptedDice
+from ludo.engine import Engine
+
+
+def test_dice_roll_faces():
+    """Every dice rolls numbers from 1 to 6."""
+    for dice in [RandomDice(random.Random(1)), BufferedDice(block_size=7)]:
+        rolls = [dice.roll() for i in range(300)]
+        assert set(rolls) == {1, 2, 3, 4, 5, 6}
+
+
+def test_buffered_dice_is_reproducible_across_blocks():
+    """Seeded buffered dice give the same rolls whatever the block size."""
+    dice_1 = BufferedDice(random.Random(3), block_size=5)
+    dice_2 = BufferedDice(random.Random(3), block_size=5)
+
+    assert [dice_1.roll() for i in range(23)] == [
+        dice_2.roll() for i in range(23)
+    ]
+
+
+def test_scripted_dice_rolls_in_order():
+    """Scripted dice give their rolls in order and then fail."""
+    dice = ScriptedDice([6, 1, 3])
+
+    assert [dice.roll(), dice.roll(), dice.roll()] == [6, 1, 3]
+    with pytest.raises(Exception):
+        dice.roll()
+
+
+def test_engine_uses_injected_dice():
+    """The engine rolls the dice it was given."""
+    engine = Engine(dice=ScriptedDice([6, 2, 5]))
+
+    turns = [engine.play_turn() for i in range(3)]
+
+    assert [turn.roll for turn in turns] == [6, 2, 5]
+    assert turns[1].move.token == turns[0].move.token
+
+
+def test_engine_seed_replays_game():
+    """An engine keeps its seed so its game can be replayed."""
+    engine_1 = Engine()
+    engine_1.play()
+
+    engine_2 = Engine(seed=engine_1.seed)
+    engine_2.play()
+
+    assert engine_1.board.snapshot() == engine_2.board.snapshot()
@@ -0,0 +1,95 @@
+"""Tests for Encoding module."""
+
+import pytest
+
+from ludo.board import Board
+from test.utils import play_position
+
+np = pytest.importorskip("numpy")
+encoding = pytest.importorskip("ludo.encoding")
+
+
+def test_encoding_layout_of_a_new_board():
+    """Every token starts in house on a safe node, blue is to move."""
+    board = Board()
+
+    features = encoding.encode(board)
+    tokens = features[: encoding.CURRENT_HOUSE_OFFSET].reshape(16, -1)
+
+    assert features.shape == (encoding.ENCODING_SIZE,)
+    assert tokens[:, encoding.IN_HOUSE_FEATURE].all()
+    assert tokens[:, encoding.SAFE_FEATURE].all()
+    assert not tokens[:, : encoding.PROGRESS_FEATURES].any()
+    assert list(features[encoding.CURRENT_HOUSE_OFFSET:]) == [1, 0, 0, 0]
+
+
+def test_encoding_follows_token_progress_in_id_order():
+    """Each token row has a one-hot of its progress."""
+    board = play_position(1, 150)
+    tokens = encoding.encode(board)[: encoding.CURRENT_HOUSE_OFFSET]
+    tokens = tokens.reshape(16, -1)
+
+    for row, token in zip(tokens, board.tokens):
+        if token.in_house:
+            assert row[encoding.IN_HOUSE_FEATURE] == 1
+        else:
+            assert np.flatnonzero(row[:57]).tolist() == [token.progress]
+
+
+def test_threat_counts_match_legal_moves():
+    """Threats count the other houses' moves capturing the token."""
+    for seed in range(5):
+        board = play_position(seed, 100)
+        for token in board.tokens:
+            captures = 0
+            for house in board.houses:
+                if house == token.house:
+                    continue
+                for other in board.house_tokens[house]:
+                    for roll in range(1, 7):
+                        if (
+                            not other.in_house
+                            and other.destination(roll) is token.current_node
+                            and not token.current_node.is_safe
+                        ):
+                            captures += 1
+            assert encoding.threat_count(board, token) == captures
+
+
+def test_encode_writes_into_the_given_buffer():
+    """The caller's buffer is cleared and filled in place."""
+    board = play_position(2, 150)
+    out = np.full(encoding.ENCODING_SIZE, 7, dtype=np.float32)
+
+    assert encoding.encode(board, out) is out
+    assert np.array_equal(out, encoding.encode(board))
+    with pytest.raises(Exception):
+        encoding.encode(board, np.zeros(3, dtype=np.float32))
+
+
+def test_perspective_rotates_houses():
+    """Seen from a house, its tokens come first."""
+    board = play_position(3, 150)
+    features = encoding.encode(board, house_index=2)
+    tokens = features[: encoding.CURRENT_HOUSE_OFFSET].reshape(16, -1)
+    rotated_tokens = encoding.encode(board)[
+        : encoding.CURRENT_HOUSE_OFFSET
+    ].reshape(16, -1)
+
+    assert np.array_equal(tokens[:4], rotated_tokens[8:12])
+    current = board.house_index(board.current_house)
+    offset = encoding.CURRENT_HOUSE_OFFSET + (current - 2) % 4
+    assert features[offset] == 1
+
+
+def test_encode_batch_matches_single_boards():
+    """Batches are one contiguous array of the single encodings."""
+    boards = [play_position(seed, 50) for seed in range(4)]
+
+    batch = encoding.encode_batch(boards)
+
+    assert batch.flags["C_CONTIGUOUS"]
+    for row, board in zip(batch, boards):
+        assert np.array_equal(row, encoding.encode(board))
+    with pytest.raises(Exception):
+        encoding.encode_batch(boards, np.zeros((2, 3), dtype=np.float32))
@@ -0,0 +1,94 @@
+"""Tests for Engine module."""
+
+import random
+
+from ludo.board import Board
+from ludo.engine import Engine
+from ludo.simulate import main, simulate
+
+
+def test_engine_plays_a_complete_game():
+    """A game ends once three houses have all their tokens at end."""
+    engine = Engine(rng=random.Random(5))
+
+    finish_order = engine.play()
+
+    assert engine.board.completed()
+    assert len(finish_order) == 3
+    assert finish_order[0] == engine.board.winner_house
+
+
+def test_seeded_games_replay_exactly():
+    """Two engines with the same seed play the same game."""
+    engine_1 = Engine(rng=random.Random(9))
+    engine_2 = Engine(rng=random.Random(9))
+
+    engine_1.play()
+    engine_2.play()
+
+    assert engine_1.board.snapshot() == engine_2.board.snapshot()
+
+
+def test_no_legal_move_passes_the_turn():
+    """A house with all tokens in house passes the turn unless it rolls 6."""
+    engine = Engine(Board())
+    board = engine.board
+
+    turn = engine.play_turn(3)
+
+    assert turn.move is None
+    assert not turn.extra_turn
+    assert board.current_house == board.red_house
+
+
+def test_six_gives_another_turn():
+    """Rolling a 6 keeps the turn with the same house."""
+    engine = Engine(Board())
+    board = engine.board
+
+    turn = engine.play_turn(6)
+
+    assert turn.move is not None
+    assert turn.extra_turn
+    assert board.current_house == board.blue_house
+    assert board.get_token(turn.move.token.id).progress == 0
+    assert board.extra_turn
+    assert board.position_key == board.compute_position_key()
+    engine.play_turn(1)
+    assert not board.extra_turn
+
+
+def test_capture_gives_another_turn():
+    """Capturing a token of another house keeps the turn."""
+    engine = Engine(Board())
+    board = engine.board
+    board.get_token(1).place(17)
+    board.get_token(5).place(0)
+    board.current_house = board.red_house
+
+    turn = engine.play_turn(4)
+
+    assert turn.record.captured
+    assert turn.extra_turn
+    assert board.current_house == board.red_house
+
+
+def test_turn_skips_finished_houses():
+    """The turn passes over houses whose tokens all reached end."""
+    engine = Engine(Board())
+    board = engine.board
+    for token in board.house_tokens[board.red_house]:
+        token.place(56)
+
+    engine.play_turn(2)
+
+    assert board.current_house == board.green_house
+
+
+def test_simulate_reports_games_per_second(capsys):
+    """The simulate entry point plays games and reports its speed."""
+    wins = simulate(3, seed=1)
+    main(["--games", "2", "--seed", "1"])
+
+    assert sum(wins.values()) == 3
+    assert "games per second" in capsys.readouterr().out
@@ -0,0 +1,68 @@
+"""Tests for Env module."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+env_module = pytest.importorskip("ludo.env")
+
+
+def random_actions(env, rng):
+    """Pick a random legal action of every game."""
+    masks = env.action_masks
+    return np.array([rng.choice(np.flatnonzero(mask)) for mask in masks])
+
+
+def test_reset_fills_preallocated_arrays():
+    """Observations and masks are filled in the arrays made once."""
+    env = env_module.VectorEnv(8, seed=1)
+    observations = env.observations
+
+    assert env.reset() is observations
+    assert observations.shape == (8, env_module.OBSERVATION_SIZE)
+    assert env.action_masks.any(1).all()
+    # Each observation has exactly one roll set.
+    assert np.allclose(observations[:, -6:].sum(1), 1)
+
+
+def test_step_reuses_arrays_and_auto_resets():
+    """Stepping returns the same arrays and finished games start over."""
+    env = env_module.VectorEnv(4, seed=2)
+    env.reset()
+    rng = np.random.default_rng(0)
+    arrays = (env.observations, env.rewards, env.dones, env.action_masks)
+    finished_rewards = []
+    for i in range(3000):
+        result = env.step(random_actions(env, rng))
+        assert all(a is b for a, b in zip(result, arrays))
+        assert env.action_masks.any(1).all()
+        finished_rewards.extend(env.rewards[env.dones].tolist())
+        assert not env.rewards[~env.dones].any()
+
+    assert env.games == len(finished_rewards) > 0
+    for reward in finished_rewards:
+        assert min(abs(reward - r) for r in (1, 1 / 3, -1 / 3, -1)) < 1e-6
+
+
+def test_illegal_actions_are_rejected():
+    """Masked actions can not be played."""
+    env = env_module.VectorEnv(1, seed=3)
+    env.reset()
+    while env.action_masks[0].all():
+        env.step(np.argmax(env.action_masks, 1))
+    illegal = np.flatnonzero(~env.action_masks[0])
+
+    with pytest.raises(Exception):
+        env.step(illegal[:1])
+
+
+def test_seeded_environments_replay():
+    """The same seed and actions give the same observations."""
+    runs = []
+    for i in range(2):
+        env = env_module.VectorEnv(3, seed=4)
+        env.reset()
+        for step in range(50):
+            env.step(np.argmax(env.action_masks, 1))
+        runs.append(env.observations.copy())
+
+    assert np.array_equal(runs[0], runs[1])
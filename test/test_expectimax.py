@@ -0,0 +1,125 @@
+"""Tests for Expectimax module."""
+
+import time
+
+from ludo.board import Board
+from ludo.engine import Engine
+from ludo.expectimax import ExpectimaxPlayer, evaluate
+from ludo.symmetry import rotate_state
+from test.utils import play_position
+
+
+def spread_position():
+    """Get a board with blue tokens spread along the path."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    board.get_token(5).place(20)
+    return board
+
+
+def test_move_values_cover_every_move_and_keep_the_board():
+    """Every legal move gets a value and the given board is unchanged."""
+    board = spread_position()
+    state = board.snapshot()
+    moves = board.legal_moves(board.blue_house, 4)
+    player = ExpectimaxPlayer(depth=1)
+
+    values = player.move_values(board, board.blue_house, 4, moves)
+
+    assert len(values) == len(moves)
+    assert board.snapshot() == state
+    assert player.board.snapshot() == state
+
+
+def test_expectimax_captures_the_leading_token():
+    """The search captures the last token of the house about to win."""
+    board = Board()
+    for house in board.houses[1:3]:
+        for token in board.house_tokens[house]:
+            token.place(56)
+    yellow_tokens = board.house_tokens[board.yellow_house]
+    for token in yellow_tokens[:3]:
+        token.place(56)
+    # Yellow progress 48 is blue progress 35.
+    yellow_tokens[3].place(48)
+    blue_tokens = board.house_tokens[board.blue_house]
+    blue_tokens[0].place(32)
+    blue_tokens[1].place(5)
+    moves = board.legal_moves(board.blue_house, 3)
+
+    move = ExpectimaxPlayer().choose(board, board.blue_house, 3, moves)
+
+    assert move.captures == (yellow_tokens[3],)
+
+
+def test_chance_values_are_memoized():
+    """Searching the same position again hits the cache."""
+    board = spread_position()
+    moves = board.legal_moves(board.blue_house, 4)
+    player = ExpectimaxPlayer(depth=2)
+    first = player.move_values(board, board.blue_house, 4, moves)
+    misses = player.cache.misses
+
+    second = player.move_values(board, board.blue_house, 4, moves)
+
+    assert second == first
+    assert player.cache.misses == misses
+    assert player.cache.hits > 0
+
+
+def test_rotated_positions_share_cached_values():
+    """A rotated position hits the cache and gets the same move values."""
+    board = spread_position()
+    moves = board.legal_moves(board.blue_house, 4)
+    player = ExpectimaxPlayer(depth=2)
+    values = player.move_values(board, board.blue_house, 4, moves)
+    rotated = Board()
+    rotated.restore(rotate_state(board.snapshot(), 2))
+    house = rotated.current_house
+    rotated_moves = rotated.legal_moves(house, 4)
+    misses = player.cache.misses
+
+    rotated_values = player.move_values(rotated, house, 4, rotated_moves)
+
+    assert house == rotated.houses[2]
+    assert rotated_values == values
+    assert player.cache.misses == misses
+
+
+def test_cache_is_bounded():
+    """The LRU cache never holds more than its size."""
+    board = spread_position()
+    moves = board.legal_moves(board.blue_house, 4)
+    player = ExpectimaxPlayer(depth=2, cache_size=10)
+
+    player.move_values(board, board.blue_house, 4, moves)
+
+    assert len(player.cache) == 10
+
+
+def test_evaluate_ranks_finished_houses_first():
+    """A finished house is worth more than any house still playing."""
+    engine = Engine(seed=4)
+    engine.play()
+    board = engine.board
+    values = evaluate(board)
+    winner = board.house_index(board.winner_house)
+
+    assert values[winner] == max(values)
+    assert min(values) < 1
+
+
+def test_expectimax_answers_quickly():
+    """A depth 2 search of a game position takes well under 50 ms."""
+    board = play_position(3, 60)
+    for roll in range(1, 7):
+        moves = board.legal_moves(board.current_house, roll)
+        if len(moves) > 1:
+            break
+    player = ExpectimaxPlayer()
+
+    start = time.perf_counter()
+    player.choose(board, board.current_house, roll, moves)
+
+    assert time.perf_counter() - start < 0.05
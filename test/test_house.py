@@ -1,6 +1,7 @@
 """Tests for House module."""
 
-from ludo.house import HouseType
+from ludo.board import Board
+from ludo.house import HouseType, PATH_LENGTH
 from ludo.node import Node, NodeType
 from ludo.token import Token
 from test.utils import DummyHouse, create_house
@@ -105,3 +106,29 @@ def test_all_tokens_not_reached_end():
     Token(blue_house_home_node_4)
 
     assert not blue_house.all_tokens_reached_end()
+
+
+def test_house_path_follows_own_fork():
+    """Each house path runs from start node through its fork to end node."""
+    board = Board()
+
+    for house in (
+        board.blue_house,
+        board.red_house,
+        board.green_house,
+        board.yellow_house,
+    ):
+        assert len(house.path) == PATH_LENGTH
+        assert house.path[0] == house.get_start_node()
+        assert house.path[-1] == house.get_end_node()
+        assert house.path[-7] == house.get_fork_node()
+        assert house.path[-6:-1] == house.house_nodes
+        assert len(set(house.path)) == PATH_LENGTH
+
+
+def test_house_path_requires_linked_houses():
+    """Building a path before the houses are linked fails."""
+    blue_house = create_house()
+
+    with pytest.raises(Exception):
+        blue_house.build_path()
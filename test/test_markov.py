@@ -0,0 +1,71 @@
+"""Tests for Markov module."""
+
+import os
+import random
+
+import pytest
+
+from ludo.board import Board
+
+np = pytest.importorskip("numpy")
+markov = pytest.importorskip("ludo.markov")
+
+
+def test_turn_matrix_rows_are_distributions():
+    """Every state moves somewhere with probability 1 in a turn."""
+    matrix = markov.turn_matrix()
+
+    assert np.allclose(matrix.sum(1), 1)
+    assert matrix[markov.END_STATE, markov.END_STATE] == 1
+
+
+def test_exact_roll_from_the_last_house_node():
+    """Needing a 1, each turn succeeds with chance 1/6 + 1/6 * 1/6 + ..."""
+    expected, distribution = markov.solve()
+
+    assert expected[55 + 1] == pytest.approx(5)
+    assert distribution[55 + 1, 1] == pytest.approx(1 / 5)
+    assert expected[markov.END_STATE] == 0
+
+
+def test_distributions_match_expected_turns():
+    """Turn distributions sum to 1 and their means are the expected turns."""
+    expected, distribution = markov.solve()
+    turns = np.arange(distribution.shape[1])
+
+    assert np.allclose(distribution.sum(1), 1)
+    assert np.allclose(distribution @ turns, expected)
+
+
+def test_expected_turns_match_token_moves():
+    """A lone token moved by the engine rules takes the expected turns."""
+    board = Board()
+    token = board.house_tokens[board.blue_house][0]
+    rng = random.Random(2)
+    num_races = 2000
+    total = 0
+    for i in range(num_races):
+        token.place(-1)
+        while not token.reached_end():
+            total += 1
+            roll = 6
+            while roll == 6 and not token.reached_end():
+                roll = rng.randint(1, 6)
+                token.move(roll)
+
+    assert total / num_races == pytest.approx(
+        markov.solve()[0][0], rel=0.03
+    )
+
+
+def test_race_table_is_cached(cache_dir):
+    """The race table is written once and read back from the cache."""
+    table = markov.get_race_table()
+    path = os.path.join(cache_dir, markov.FILE_NAME)
+    assert os.path.exists(path)
+
+    cached = markov.RaceTable(path)
+
+    assert cached.expected_turns(-1) == table.expected_turns(-1)
+    assert cached.probability_within(55, 1) == pytest.approx(1 / 5)
+    assert cached.probability_within(-1, 10**6) == pytest.approx(1)
@@ -0,0 +1,168 @@
+"""Tests for MCTS module."""
+
+import random
+
+import pytest
+
+from ludo.board import Board
+from ludo.engine import Engine
+from ludo import mcts
+from ludo.mcts import MCTSPlayer, RootParallelMCTSPlayer, main, rewards
+
+
+def test_mcts_chooses_a_legal_move_and_keeps_the_board():
+    """The search plays on its own board and returns one of the moves."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    state = board.snapshot()
+    key = board.position_key
+    moves = board.legal_moves(board.blue_house, 3)
+    player = MCTSPlayer(playouts=50, rng=random.Random(1))
+
+    move = player.choose(board, board.blue_house, 3, moves)
+
+    assert move in moves
+    assert board.snapshot() == state
+    assert board.position_key == key
+    assert player.stats.playouts == 50
+    assert player.stats.playouts_per_second > 0
+
+
+def test_mcts_reuses_the_table_between_moves():
+    """Positions searched before keep their visits for the next search."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 3)
+    player = MCTSPlayer(playouts=40, rng=random.Random(2))
+    player.choose(board, board.blue_house, 3, moves)
+    root_visits = player.table[board.position_key].visits
+
+    player.choose(board, board.blue_house, 3, moves)
+
+    assert player.table[board.position_key].visits == root_visits + 40
+
+
+def test_mcts_captures_the_leading_token():
+    """The search captures the last token of the house about to win."""
+    board = Board()
+    for house in board.houses[1:3]:
+        for token in board.house_tokens[house]:
+            token.place(56)
+    yellow_tokens = board.house_tokens[board.yellow_house]
+    for token in yellow_tokens[:3]:
+        token.place(56)
+    # Yellow progress 48 is blue progress 35.
+    yellow_tokens[3].place(48)
+    blue_tokens = board.house_tokens[board.blue_house]
+    blue_tokens[0].place(32)
+    blue_tokens[1].place(5)
+    moves = board.legal_moves(board.blue_house, 3)
+    player = MCTSPlayer(playouts=100, rng=random.Random(3))
+
+    move = player.choose(board, board.blue_house, 3, moves)
+
+    assert move.captures == (yellow_tokens[3],)
+
+
+def test_mcts_respects_the_time_limit():
+    """A time limit stops the search before the playout budget."""
+    board = Board()
+    board.get_token(1).place(0)
+    moves = board.legal_moves(board.blue_house, 6)
+    player = MCTSPlayer(playouts=10**9, time_limit=0.05)
+
+    player.choose(board, board.blue_house, 6, moves)
+
+    assert 0 < player.stats.playouts < 10**9
+    assert player.stats.elapsed < 1
+
+
+def test_mcts_searches_by_time_alone():
+    """Without a playout budget the search runs until the time limit."""
+    board = Board()
+    board.get_token(1).place(0)
+    moves = board.legal_moves(board.blue_house, 6)
+    player = MCTSPlayer(playouts=None, time_limit=0.05)
+
+    player.choose(board, board.blue_house, 6, moves)
+
+    assert player.stats.playouts > 0
+    assert 0.05 <= player.stats.elapsed < 1
+    with pytest.raises(Exception):
+        MCTSPlayer(playouts=None)
+
+
+def test_mcts_main_searches_by_time(capsys):
+    """Given --time alone, the entry point searches without a budget."""
+    main(["--time", "0.02", "--moves", "1", "--seed", "1"])
+
+    assert "1 searches" in capsys.readouterr().out
+
+
+def test_rewards_rank_finished_houses_first():
+    """Finished houses take the first places in finish order."""
+    engine = Engine(seed=4)
+    engine.play()
+    board = engine.board
+    result = rewards(board)
+
+    assert result[board.house_index(board.finish_order[0])] == 1.0
+    assert sorted(result) == [0.0, 1 / 3, 2 / 3, 1.0]
+
+
+def test_mcts_reports_playout_rate(capsys):
+    """The entry point prints the playouts per second."""
+    main(["--playouts", "20", "--moves", "2", "--seed", "1"])
+
+    assert "playouts per second" in capsys.readouterr().out
+
+
+def test_root_parallel_search_merges_root_visits():
+    """Searches of all processes add up to the chosen move's statistics."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 3)
+    player = RootParallelMCTSPlayer(processes=2, seed=1, playouts=20)
+    try:
+        move = player.choose(board, board.blue_house, 3, moves)
+    finally:
+        player.close()
+
+    assert move in moves
+    assert player.stats.playouts == 40
+
+
+def test_tasks_in_one_worker_do_not_share_root_visits(monkeypatch):
+    """Two tasks of a search run by one worker count their own visits."""
+    monkeypatch.setattr(mcts, "_worker_players", {})
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    state = board.snapshot()
+    options = {"playouts": 20}
+
+    for index in range(2):
+        visits, playouts = mcts._search_root(
+            (index, state, 3, index, options)
+        )
+
+        assert sum(visits.values()) == playouts == 20
+
+
+def test_root_parallel_search_is_seeded():
+    """The same seed chooses the same moves in one process."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 3)
+    choices = [
+        RootParallelMCTSPlayer(processes=1, seed=5, playouts=30).choose(
+            board, board.blue_house, 3, moves
+        )
+        for i in range(2)
+    ]
+
+    assert choices[0] == choices[1]
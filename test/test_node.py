@@ -170,3 +170,30 @@ def test_end_node_does_not_have_house():
     """Handle Exception when create End node without house fails."""
     with pytest.raises(Exception):
         Node(NodeType.END)
+
+
+def test_empty_nodes_share_token_set():
+    """Empty nodes share one empty token set until a token is added."""
+    blue_house = DummyHouse(HouseType.BLUE)
+    node_1 = Node()
+    node_2 = Node()
+
+    assert node_1.tokens is node_2.tokens
+    assert len(node_1.tokens) == 0
+
+    token = Token(Node(NodeType.HOME, blue_house))
+    node_1.add_token(token)
+    assert token in node_1.tokens
+    assert len(node_2.tokens) == 0
+
+    node_1.remove_token(token)
+    assert node_1.tokens is node_2.tokens
+    with pytest.raises(KeyError):
+        node_1.remove_token(token)
+
+
+def test_node_has_no_instance_dict():
+    """Nodes use slots to keep many boards small."""
+    node = Node()
+
+    assert not hasattr(node, "__dict__")
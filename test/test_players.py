@@ -0,0 +1,139 @@
+"""Tests for Players module."""
+
+import random
+
+import pytest
+
+from ludo.board import Board
+from ludo.engine import Engine, play_games
+from ludo.players import (
+    CaptureFirstPlayer,
+    Decision,
+    GreedyPlayer,
+    Player,
+    RandomPlayer,
+    SafeSquarePlayer,
+    make_player,
+)
+from ludo.simulate import main
+
+
+def test_greedy_player_advances_the_furthest_token():
+    """The greedy player moves the token ending furthest along."""
+    board = Board()
+    token_1, token_2, token_3, token_4 = board.house_tokens[board.blue_house]
+    token_1.place(3)
+    token_2.place(20)
+    moves = board.legal_moves(board.blue_house, 6)
+
+    move = GreedyPlayer().choose(board, board.blue_house, 6, moves)
+
+    assert move.token == token_2
+
+
+def test_capture_first_player_prefers_captures():
+    """The capture first player captures over advancing further."""
+    board = Board()
+    blue_token_1, blue_token_2 = board.house_tokens[board.blue_house][:2]
+    blue_token_1.place(3)
+    blue_token_2.place(20)
+    red_token = board.house_tokens[board.red_house][0]
+    red_token.place(46)
+    moves = board.legal_moves(board.blue_house, 4)
+
+    move = CaptureFirstPlayer().choose(board, board.blue_house, 4, moves)
+
+    assert move.token == blue_token_1
+    assert move.captures == (red_token,)
+
+
+def test_safe_square_player_avoids_threatened_squares():
+    """The safe square player does not end where it can be captured."""
+    board = Board()
+    blue_token_1, blue_token_2 = board.house_tokens[board.blue_house][:2]
+    blue_token_1.place(3)
+    blue_token_2.place(20)
+    # Red progress 7 is two squares behind blue progress 22.
+    red_token = board.house_tokens[board.red_house][0]
+    red_token.place(7)
+    moves = board.legal_moves(board.blue_house, 2)
+    threats = board.threat_mask(board.blue_house)
+    assert threats >> board.blue_house.path[22].square & 1
+
+    move = SafeSquarePlayer().choose(board, board.blue_house, 2, moves)
+
+    assert move.token == blue_token_1
+
+
+def test_random_player_is_seeded():
+    """Random players with equal seeds make equal choices."""
+    board = Board()
+    for token, progress in zip(board.tokens[:4], [1, 5, 9, 13]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 3)
+    choices = [
+        [
+            RandomPlayer(random.Random(seed)).choose(
+                board, board.blue_house, 3, moves
+            )
+            for seed in range(10)
+        ]
+        for i in range(2)
+    ]
+
+    assert choices[0] == choices[1]
+    assert len(set(choices[0])) > 1
+
+
+def test_engine_uses_the_players_of_the_houses():
+    """Each house chooses its moves with its own player."""
+    chosen = []
+
+    class RecordingPlayer(GreedyPlayer):
+        def choose(self, board, house, roll, moves):
+            chosen.append(house)
+            return super().choose(board, house, roll, moves)
+
+    players = [RandomPlayer(random.Random(1)), RecordingPlayer()]
+    engine = Engine(seed=2, players=players + [GreedyPlayer()] * 2)
+    engine.play()
+
+    assert chosen
+    assert set(chosen) == {engine.board.red_house}
+
+
+def test_play_games_calls_choose_batch_once_per_round():
+    """Lockstep games pass all their decisions to the player at once."""
+    batch_sizes = []
+
+    class BatchPlayer(Player):
+        def choose(self, board, house, roll, moves):
+            raise Exception("Decisions are made in batches.")
+
+        def choose_batch(self, decisions):
+            assert all(isinstance(d, Decision) for d in decisions)
+            batch_sizes.append(len(decisions))
+            return [decision.moves[0] for decision in decisions]
+
+    player = BatchPlayer()
+    engines = [Engine(seed=seed, players=[player] * 4) for seed in range(8)]
+
+    finish_orders = play_games(engines)
+
+    assert all(engine.board.completed() for engine in engines)
+    assert [len(order) for order in finish_orders] == [3] * 8
+    assert max(batch_sizes) > 1
+
+
+def test_make_player_rejects_unknown_names():
+    """Only built-in players are made by name."""
+    assert isinstance(make_player("safe"), SafeSquarePlayer)
+    with pytest.raises(Exception):
+        make_player("perfect")
+
+
+def test_simulate_with_players(capsys):
+    """The simulate entry point plays the named players."""
+    main(["--games", "5", "--seed", "1", "--players", "greedy"])
+
+    assert "5 games in" in capsys.readouterr().out
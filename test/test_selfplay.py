@@ -0,0 +1,100 @@
+"""Tests for Self-Play module."""
+
+import os
+
+import pytest
+
+from ludo.engine import Engine
+
+np = pytest.importorskip("numpy")
+selfplay = pytest.importorskip("ludo.selfplay")
+
+
+def test_game_samples_have_back_filled_outcomes():
+    """Every sample of a house gets the house's final outcome."""
+    engine = Engine(seed=1)
+
+    samples = selfplay.play_game(engine)
+
+    outcomes = selfplay.outcomes(engine.board)
+    assert len(samples["states"]) == len(samples["outcomes"]) > 0
+    for house_index in range(4):
+        house_outcomes = samples["outcomes"][samples["houses"] == house_index]
+        assert np.all(house_outcomes == np.float32(outcomes[house_index]))
+    assert samples["actions"].max() < 4
+    assert set(samples["rolls"].tolist()) <= {1, 2, 3, 4, 5, 6}
+
+
+def test_shard_writer_splits_samples_into_fixed_shards(tmp_path):
+    """Samples spill into new shards once a shard is full."""
+    writer = selfplay.ShardWriter(str(tmp_path), 100)
+    game = selfplay.play_game(Engine(seed=2))
+    arrays = writer.arrays
+
+    for i in range(3):
+        writer.add(game)
+    writer.flush()
+
+    assert writer.arrays is arrays
+    assert writer.samples == 3 * len(game["rolls"])
+    sizes = []
+    for path in writer.paths:
+        with np.load(path) as shard:
+            sizes.append(len(shard["rolls"]))
+            assert shard["states"].shape[1] == game["states"].shape[1]
+    assert sum(sizes) == writer.samples
+    assert all(size == 100 for size in sizes[:-1])
+
+
+def test_shard_writer_numbers_on_after_existing_shards(tmp_path):
+    """A second writer in the same directory keeps the earlier shards."""
+    game = selfplay.play_game(Engine(seed=2))
+    first = selfplay.ShardWriter(str(tmp_path), 100)
+    first.add(game)
+    first.flush()
+
+    second = selfplay.ShardWriter(str(tmp_path), 100)
+    second.add(game)
+    second.flush()
+
+    assert not set(first.paths) & set(second.paths)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(path) for path in first.paths + second.paths
+    )
+
+
+def test_run_selfplay_streams_games_from_workers(tmp_path):
+    """Workers' games all end up in the shards."""
+    writer = selfplay.run_selfplay(
+        6, str(tmp_path), seed=3, processes=2, shard_size=500
+    )
+
+    total = 0
+    for path in writer.paths:
+        with np.load(path) as shard:
+            total += len(shard["rolls"])
+            assert set(np.unique(shard["outcomes"])) <= {
+                np.float32(value) for value in (1, 1 / 3, -1 / 3, -1)
+            }
+    assert total == writer.samples > 0
+
+
+def test_run_selfplay_reports_failed_workers(tmp_path):
+    """A worker failing stops the run with an error instead of hanging."""
+    with pytest.raises(Exception):
+        selfplay.run_selfplay(
+            2, str(tmp_path), processes=1, player="unknown"
+        )
+
+
+def test_run_selfplay_stops_workers_when_writing_fails(tmp_path, monkeypatch):
+    """A failing writer raises instead of waiting on blocked workers."""
+
+    def add(self, samples):
+        raise Exception("Disk full.")
+
+    monkeypatch.setattr(selfplay.ShardWriter, "add", add)
+    with pytest.raises(Exception, match="Disk full"):
+        selfplay.run_selfplay(
+            20, str(tmp_path), processes=2, queue_size=1
+        )
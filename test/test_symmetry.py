@@ -0,0 +1,68 @@
+"""Tests for Symmetry module."""
+
+import random
+
+from ludo.board import Board
+from ludo.symmetry import canonical_key, canonical_state, rotate_state
+from test.utils import play_position
+
+
+def test_rotating_four_times_gives_the_same_state():
+    """Rotations compose and four of them are the identity."""
+    state = play_position(1, 120).snapshot()
+
+    assert rotate_state(state, 0) == state
+    assert rotate_state(rotate_state(state, 1), 3) == state
+    assert rotate_state(rotate_state(state, 2), 2) == state
+
+
+def test_rotated_positions_share_a_canonical_state():
+    """The same position seen from any house has one canonical state."""
+    state = play_position(2, 150).snapshot()
+    canonical = canonical_state(state)
+
+    assert canonical.current_house == 0
+    for shift in range(4):
+        assert canonical_state(rotate_state(state, shift)) == canonical
+
+
+def test_rotated_positions_play_the_same():
+    """A rotated position has the same legal moves and captures."""
+    rng = random.Random(4)
+    for seed in range(10):
+        board = play_position(seed, rng.randint(20, 200))
+        state = board.snapshot()
+        rotated = Board()
+        rotated.restore(rotate_state(state, rng.randint(1, 3)))
+        for roll in range(1, 7):
+            moves = board.legal_moves(board.current_house, roll)
+            rotated_moves = rotated.legal_moves(rotated.current_house, roll)
+            assert [
+                (move.token.progress, len(move.captures)) for move in moves
+            ] == [
+                (move.token.progress, len(move.captures))
+                for move in rotated_moves
+            ]
+
+
+def test_canonical_state_sorts_tokens_of_a_house():
+    """Tokens of a house are interchangeable in the canonical state."""
+    board = Board()
+    other = Board()
+    board.get_token(1).place(7)
+    other.get_token(3).place(7)
+
+    assert board.snapshot() != other.snapshot()
+    assert canonical_state(board.snapshot()) == canonical_state(
+        other.snapshot()
+    )
+
+
+def test_canonical_key_is_the_position_key_of_the_canonical_state():
+    """Rotations share the canonical key, the key of the canonical board."""
+    state = play_position(3, 90).snapshot()
+    board = Board()
+    board.restore(canonical_state(state))
+
+    for shift in range(4):
+        assert canonical_key(rotate_state(state, shift)) == board.position_key
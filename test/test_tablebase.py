@@ -0,0 +1,119 @@
+"""Tests for Tablebase module."""
+
+import os
+import random
+
+import pytest
+
+from ludo.board import Board
+from ludo.expectimax import ExpectimaxPlayer
+from ludo.tablebase import (
+    FILE_NAME,
+    Tablebase,
+    endgame_move,
+    get_tablebase,
+)
+
+
+def test_expected_turns_of_simple_positions():
+    """One token needing an exact roll takes five turns, like the race."""
+    tablebase = get_tablebase()
+
+    assert tablebase.expected_turns((56, 56, 56, 56)) == 0
+    assert tablebase.expected_turns((56, 56, 56, 55)) == pytest.approx(5)
+    assert tablebase.expected_turns((51, 51, 51, 51)) > 4 * 5 / 2
+
+
+def test_expected_turns_match_the_race_of_a_lone_token():
+    """A lone token on the house nodes takes the race table's turns."""
+    pytest.importorskip("numpy")
+    from ludo.markov import get_race_table
+
+    tablebase = get_tablebase()
+    for progress in range(51, 56):
+        assert tablebase.expected_turns(
+            (56, 56, 56, progress)
+        ) == pytest.approx(get_race_table().expected_turns(progress))
+
+
+def test_tablebase_matches_simulated_turns():
+    """Playing the best moves finishes in the expected number of turns."""
+    tablebase = get_tablebase()
+    rng = random.Random(1)
+    start = (51, 52, 54, 55)
+    total = 0
+    num_games = 4000
+    for i in range(num_games):
+        progress = list(start)
+        while any(p != 56 for p in progress):
+            roll = rng.randint(1, 6)
+            # A 6 rolls again, any other roll ends the turn.
+            total += roll != 6
+            token_progress = tablebase.best_move(progress, roll)
+            if token_progress is not None:
+                progress[progress.index(token_progress)] += roll
+
+    assert total / num_games == pytest.approx(
+        tablebase.expected_turns(start), rel=0.05
+    )
+
+
+def test_best_move_is_legal():
+    """Best moves never overshoot end."""
+    tablebase = get_tablebase()
+    assert tablebase.best_move((53, 56, 56, 56), 4) is None
+    assert tablebase.best_move((53, 56, 56, 56), 3) == 53
+    assert tablebase.best_move((52, 54, 56, 56), 2) in (52, 54)
+
+
+def test_tablebase_file_is_built_once(cache_dir):
+    """The table is written to the cache directory and read back."""
+    path = os.path.join(cache_dir, FILE_NAME)
+    get_tablebase()
+    modified = os.path.getmtime(path)
+
+    tablebase = Tablebase(path)
+
+    assert os.path.getmtime(path) == modified
+    assert tablebase.expected_turns((56, 56, 56, 55)) == pytest.approx(5)
+    tablebase.close()
+
+
+def test_tablebase_of_an_older_version_is_rebuilt(tmp_path):
+    """A table file with an older header is built again."""
+    path = tmp_path / FILE_NAME
+    path.write_bytes(b"LUDOTB1\0" + bytes(16))
+
+    tablebase = Tablebase(str(path))
+
+    assert tablebase.expected_turns((56, 56, 56, 55)) == pytest.approx(5)
+    tablebase.close()
+
+
+def test_tablebase_rejects_other_files(tmp_path):
+    """Files without the tablebase header are not read as tables."""
+    path = tmp_path / "other.tb"
+    path.write_bytes(b"not a table")
+
+    with pytest.raises(Exception):
+        Tablebase(str(path))
+
+
+def test_endgame_move_only_in_the_endgame():
+    """Players use the table once every token is on the house nodes."""
+    board = Board()
+    tokens = board.house_tokens[board.blue_house]
+    for token, progress in zip(tokens, [52, 54, 56, 56]):
+        token.place(progress)
+    moves = board.legal_moves(board.blue_house, 2)
+
+    move = endgame_move(board, board.blue_house, 2, moves)
+    assert move.token.progress == get_tablebase().best_move(
+        [52, 54, 56, 56], 2
+    )
+    assert ExpectimaxPlayer().choose(board, board.blue_house, 2, moves) == (
+        move
+    )
+    tokens[0].place(40)
+    moves = board.legal_moves(board.blue_house, 2)
+    assert endgame_move(board, board.blue_house, 2, moves) is None
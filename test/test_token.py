@@ -1,5 +1,6 @@
 """Tests for Token module."""
 
+from ludo.board import Board
 from ludo.token import Token
 from ludo.node import Node, NodeType
 from test.utils import create_nodes, create_dummy_house, create_house
@@ -472,3 +473,113 @@ def test_same_house_token_reaches_end_node():
     assert token_1.reached_end()
     assert len(token_1.current_node.tokens) == 1
     assert token_1.current_node.node_type == NodeType.END
+
+
+def test_token_moves_along_house_path():
+    """A board token moves by index along its house path."""
+    board = Board()
+    token = next(iter(board.red_house.tokens))
+
+    token.move(6)
+    assert token.progress == 0
+    assert token.current_node == board.red_house.get_start_node()
+
+    token.move(5)
+    assert token.progress == 5
+    assert token.current_node == board.red_house.path[5]
+    assert token in token.current_node.tokens
+    assert len(board.red_house.get_start_node().tokens) == 0
+
+
+def test_token_path_move_matches_linked_walk():
+    """Moving by path index lands on the same node as walking the links."""
+    board = Board()
+    token = next(iter(board.green_house.tokens))
+    token.move(6)
+
+    for roll in [6, 6, 6, 6, 6, 6, 6, 6, 2]:
+        expected_node = token.current_node
+        for i in range(roll):
+            if (
+                expected_node.node_type == NodeType.FORK
+                and expected_node.house == token.house
+            ):
+                expected_node = expected_node.next_house_node
+            else:
+                expected_node = expected_node.next_node
+        token.move(roll)
+        assert token.current_node == expected_node
+
+    assert token.current_node == board.green_house.get_fork_node()
+    token.move(6)
+    assert token.reached_end()
+
+
+def test_token_does_not_overshoot_end_node():
+    """A token in the house nodes needs an exact roll to reach the end."""
+    board = Board()
+    token = next(iter(board.blue_house.tokens))
+    token.move(6)
+    for i in range(8):
+        token.move(6)
+    token.move(5)
+    assert token.current_node == board.blue_house.house_nodes[2]
+
+    token.move(4)
+    assert token.current_node == board.blue_house.house_nodes[2]
+
+    token.move(3)
+    assert token.reached_end()
+
+    token.move(1)
+    assert token.reached_end()
+
+
+def finish_house(house):
+    """Move every token of the house to its end node."""
+    for token in house.tokens:
+        for roll in [6, 6, 6, 6, 6, 6, 6, 6, 6, 2, 6]:
+            token.move(roll)
+        assert token.reached_end()
+
+
+def test_next_house_skips_finished_houses_in_turn_order():
+    """Next house is the next unfinished house even with stale pointers."""
+    board = Board()
+    board.blue_house.next_house = board.red_house
+    board.red_house.next_house = board.yellow_house
+    board.yellow_house.next_house = board.red_house
+    finish_house(board.red_house)
+    finish_house(board.yellow_house)
+    token = next(iter(board.blue_house.tokens))
+    token.move(6)
+
+    token.move(1)
+
+    assert board.blue_house.next_house == board.green_house
+
+
+def test_next_house_when_every_other_house_finished():
+    """Moving the last unfinished house's token keeps its next house."""
+    board = Board()
+    for house in [board.red_house, board.green_house, board.yellow_house]:
+        finish_house(house)
+    next_house = board.blue_house.next_house
+    token = next(iter(board.blue_house.tokens))
+    token.move(6)
+
+    token.move(1)
+
+    assert board.blue_house.next_house == next_house
+
+
+def test_next_house_when_every_house_finished():
+    """Setting the next house ends once every house has finished."""
+    board = Board()
+    for house in board.houses:
+        finish_house(house)
+    next_house = board.blue_house.next_house
+
+    next(iter(board.blue_house.tokens)).move(1)
+
+    assert board.blue_house.next_house == next_house
@@ -0,0 +1,39 @@
+"""Tests for Tournament module."""
+
+import pytest
+
+from ludo.tournament import main, run_tournament, stream_seed
+
+
+def test_stream_seeds_are_reproducible_and_distinct():
+    """Each stream of a master seed has its own reproducible seed."""
+    assert stream_seed(1, 0) == stream_seed(1, 0)
+    assert stream_seed(1, 0) != stream_seed(1, 1)
+    assert stream_seed(1, 0) != stream_seed(2, 0)
+
+
+def test_tournament_results_do_not_depend_on_processes():
+    """The same seed gives the same results in and out of a pool."""
+    result_1 = run_tournament(12, seed=4, processes=1, chunk_size=5)
+    result_2 = run_tournament(12, seed=4, processes=2, chunk_size=5)
+
+    assert result_1.games == result_2.games == 12
+    assert result_1.placings == result_2.placings
+    assert result_1.turns == result_2.turns
+
+
+def test_tournament_placings_add_up():
+    """Every game gives every house exactly one place."""
+    result = run_tournament(6, seed=1, processes=1, chunk_size=4)
+
+    assert sum(result.wins) == 6
+    for place in range(4):
+        assert sum(placings[place] for placings in result.placings) == 6
+    assert sum(result.win_rates()) == pytest.approx(1.0)
+
+
+def test_tournament_entry_point(capsys):
+    """The tournament entry point reports win rates."""
+    main(["--games", "2", "--processes", "1"])
+
+    assert "wins" in capsys.readouterr().out
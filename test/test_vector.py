@@ -0,0 +1,79 @@
+"""Tests for Vector module."""
+
+import random
+
+import pytest
+
+from ludo.engine import Engine
+
+np = pytest.importorskip("numpy")
+vector = pytest.importorskip("ludo.vector")
+
+
+def test_tables_map_paths_to_track_squares():
+    """Paths of every house cover the 52 track squares once each."""
+    squares, safe = vector.tables()
+
+    for house_index in range(4):
+        track = squares[house_index, 1:52]
+        assert len(set(track.tolist())) == 51
+        assert (squares[house_index, 52:] == -1).all()
+        assert squares[house_index, 0] == -1
+    assert squares[1, 1] == squares[0, 14]
+    assert safe.sum() == 8
+
+
+def test_vector_turns_match_engine_turns():
+    """A vector turn with one legal move plays like the object engine."""
+    engine = Engine(rng=random.Random(2))
+    board = engine.board
+    games = vector.VectorGames(1, seed=0)
+    compared = 0
+    while not board.completed():
+        roll = engine.roll_dice()
+        moves = board.legal_moves(board.current_house, roll)
+        if len(moves) <= 1:
+            games.load(0, board.snapshot())
+            games.step(np.array([roll], dtype=np.int8))
+            engine.play_turn(roll)
+            state = games.state(0)
+            expected = board.snapshot()
+            assert state.progress == expected.progress
+            assert state.current_house == expected.current_house
+            assert state.finish_order == expected.finish_order
+            compared += 1
+        else:
+            engine.play_turn(roll)
+    assert compared > 100
+
+
+def test_vector_games_complete():
+    """Every vector game ends with three ranked houses and a winner."""
+    games = vector.VectorGames(64, seed=3)
+
+    winners = games.run()
+
+    assert games.done.all()
+    assert (winners >= 0).all()
+    assert (games.finished.sum(1) == 3).all()
+    assert (games.turns > 0).all()
+
+
+def test_vector_games_are_reproducible():
+    """Vector games with the same seed play the same games."""
+    games_1 = vector.VectorGames(16, seed=5)
+    games_2 = vector.VectorGames(16, seed=5)
+
+    assert (games_1.run() == games_2.run()).all()
+    assert (games_1.turns == games_2.turns).all()
+
+
+def test_simulate_vector_backend(capsys):
+    """The simulate entry point can run the vector backend."""
+    from ludo.simulate import main, simulate_vector
+
+    wins = simulate_vector(8, seed=1)
+    main(["--games", "4", "--backend", "vector"])
+
+    assert sum(wins.values()) == 8
+    assert "games per second" in capsys.readouterr().out
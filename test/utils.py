@@ -1,5 +1,6 @@
 """Create this utils for testing purpose."""
 
+from ludo.engine import Engine
 from ludo.house import House, HouseType
 from ludo.node import Node, NodeType
 
@@ -21,12 +22,11 @@ class DummyHouse(House):
 
 
 def create_nodes(num_nodes, home_node_house):
-    """Create nodes with no of nodes input."""
-    Node.internal_id = 0
-    nodes = [Node(NodeType.HOME, home_node_house)]
+    """Create nodes with no of nodes input, numbered from node id 0."""
+    nodes = [Node(NodeType.HOME, home_node_house, 0)]
 
-    for i in range(num_nodes - 1):
-        nodes.append(Node())
+    for i in range(1, num_nodes):
+        nodes.append(Node(node_id=i))
 
     # Set the next node for each node.
     for i in range(1, num_nodes):
@@ -61,3 +61,11 @@ def create_house():
     green_house.next_house = yellow_house
     yellow_house.next_house = blue_house
     return blue_house
+
+
+def play_position(seed, turns):
+    """Get a board after some random turns."""
+    engine = Engine(seed=seed)
+    for turn in range(turns):
+        engine.play_turn()
+    return engine.board